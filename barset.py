@@ -0,0 +1,91 @@
+# barset.py
+import numpy as np
+
+
+class BarSet:
+    """
+    Набор стержней в виде непрерывных столбцов NumPy: L, A, E, sigma, q
+    Читается из списка словарей проекта и записывается обратно в него
+    """
+    FIELDS = ('L', 'A', 'E', 'sigma', 'q')
+
+    def __init__(self, L=(), A=(), E=(), sigma=(), q=None):
+        self.L = np.array(L, dtype=float).reshape(-1)
+        self.A = np.array(A, dtype=float).reshape(-1)
+        self.E = np.array(E, dtype=float).reshape(-1)
+        self.sigma = np.array(sigma, dtype=float).reshape(-1)
+        if q is None:
+            self.q = np.zeros(len(self.L), dtype=float)
+        else:
+            self.q = np.array(q, dtype=float).reshape(-1)
+        self._node_positions = None
+
+    @classmethod
+    def from_dicts(cls, bars):
+        """
+        Создание набора из списка словарей {'L', 'A', 'E', 'sigma', 'q'}
+        """
+        data = np.array(
+            [[bar.get(field, 0.0) for field in cls.FIELDS] for bar in bars],
+            dtype=float
+        ).reshape(-1, len(cls.FIELDS))
+        return cls(*data.T)
+
+    @classmethod
+    def coerce(cls, bars):
+        """
+        Приведение к BarSet: готовый набор возвращается как есть
+        """
+        if isinstance(bars, cls):
+            return bars
+        return cls.from_dicts(bars)
+
+    def to_dicts(self):
+        """
+        Запись в формат списка словарей (для JSON проекта)
+        """
+        columns = [getattr(self, field).tolist() for field in self.FIELDS]
+        return [dict(zip(self.FIELDS, values)) for values in zip(*columns)]
+
+    def copy(self):
+        return BarSet(self.L, self.A, self.E, self.sigma, self.q)
+
+    def __len__(self):
+        return len(self.L)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return BarSet(*(getattr(self, field)[index] for field in self.FIELDS))
+        return {field: float(getattr(self, field)[index]) for field in self.FIELDS}
+
+    def __iter__(self):
+        return iter(self.to_dicts())
+
+    def set_value(self, index, field, value):
+        """
+        Изменение параметра одного стержня с учётом кэша координат узлов
+        """
+        getattr(self, field)[index] = value
+        if field == 'L':
+            self.invalidate()
+
+    def invalidate(self):
+        """
+        Сброс кэша после изменения длин стержней напрямую через столбцы
+        """
+        self._node_positions = None
+
+    @property
+    def node_positions(self):
+        """
+        Координаты узлов (префиксные суммы длин), кэшируются
+        """
+        if self._node_positions is None:
+            positions = np.zeros(len(self.L) + 1, dtype=float)
+            np.cumsum(self.L, out=positions[1:])
+            self._node_positions = positions
+        return self._node_positions
+
+    @property
+    def total_length(self):
+        return float(self.node_positions[-1])
@@ -1,41 +1,177 @@
 import sys
 import json
+import math
+import numpy as np
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QTableWidget, QTableWidgetItem, QLabel, QComboBox,
+    QPushButton, QTableView, QLabel, QComboBox,
     QHeaderView, QFrame, QCheckBox, QToolTip, QFileDialog, QMessageBox
 )
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QAction
-from PySide6.QtCore import Qt, QRectF
-from processor import RodStructureProcessor
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QAction, QPixmap
+from PySide6.QtCore import Qt, QRect, QLine, QTimer
+from barset import BarSet
 from postprocessor import PostProcessor 
 from results_dialog import ResultsDialog
+from workers import CalculationWorker, calculation_pool
+from table_models import InputTableModel
 
 # ------------------------
 # Холст для рисования
 # ------------------------
 class StructureCanvas(QWidget):
+    # Запас в пикселях при отсечении элементов за пределами видимой области
+    CULL_MARGIN = 60
+    # Пауза колеса мыши, после которой слой геометрии перерисовывается в новом масштабе
+    ZOOM_SETTLE_MS = 200
+
     def __init__(self, bars, supports, node_forces, show_grid=True):
         super().__init__()
-        self.bars = bars
-        self.supports = supports
-        self.node_forces = node_forces
+        # Кэшированные слои: сетка и статическая геометрия с ключами актуальности
+        self._grid_layer = None
+        self._grid_key = None
+        self._geometry_layer = None
+        self._geometry_key = None
+        self._geometry_zoom = None
+        self._data_version = 0
+        self._max_A = None
+        self._force_index = None
+        self._force_index_version = None
+        self._bars = self._supports = self._node_forces = None
+
+        self.set_model(bars, supports, node_forces)
         self.show_grid = show_grid
         self.setMouseTracking(True)
         self.hover_text = ""
         self.setMinimumHeight(400)
         self.zoom_factor = 1.0  # Текущий коэффициент увеличения
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.timeout.connect(self.update)
         self.setToolTip("Колесо мыши — масштабирование, Ctrl+Колесо — быстрое масштабирование")
 
+    def set_model(self, bars, supports, node_forces):
+        """
+        Замена модели целиком: слой геометрии перестраивается при следующей отрисовке
+        Если стержни (тот же объект, не изменённый на месте), опоры и силы
+        совпадают с текущими, кэш не сбрасывается
+        """
+        if (bars is self._bars
+                and supports == self._supports and node_forces == self._node_forces):
+            return
+        self._bars = bars
+        self._supports = supports
+        self._node_forces = node_forces
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Сброс кэша геометрии после изменения стержней или нагрузок
+        """
+        self._data_version += 1
+        self._max_A = None
+        self.update()
+
+    @property
+    def bars(self):
+        return self._bars
+
+    @bars.setter
+    def bars(self, value):
+        self._bars = value
+        self.invalidate()
+
+    @property
+    def supports(self):
+        return self._supports
+
+    @supports.setter
+    def supports(self, value):
+        self._supports = value
+        self.invalidate()
+
+    @property
+    def node_forces(self):
+        return self._node_forces
+
+    @node_forces.setter
+    def node_forces(self, value):
+        self._node_forces = value
+        self.invalidate()
+
+    @property
+    def max_A(self):
+        """
+        Наибольшая площадь сечения, кэшируется до изменения модели
+        """
+        if self._max_A is None:
+            self._max_A = max(float(self.bars.A.max()), 1)
+        return self._max_A
+
+    def view_transform(self):
+        """
+        Преобразование координат модели в экранные: x_экр = offset + x * scale
+        Возвращает offset, scale и положение оси y_axis
+        """
+        node_positions = self.bars.node_positions
+        total_length = node_positions[-1] if node_positions[-1]>0 else 10
+        base_scale = (self.width() - 100)/total_length
+        scale = base_scale * self.zoom_factor  # 🔹 применяем масштабирование
+        return 50, scale, self.height()//2
+
+    def force_index(self):
+        """
+        Индекс сосредоточенных сил для подсказок: координаты узлов в модели
+        по возрастанию, исходные номера сил и их значения.
+        Перестраивается только при изменении модели, масштаб учитывается при запросе
+        """
+        if self._force_index is None or self._force_index_version != self._data_version:
+            n_nodes = len(self.bars) + 1
+            forces = [f for f in self.node_forces if 0 <= f['node']-1 < n_nodes]
+            nodes = np.array([f['node']-1 for f in forces], dtype=int)
+            order = np.argsort(nodes, kind='stable')
+            self._force_index = (
+                self.bars.node_positions[nodes[order]],
+                order,
+                [f['F'] for f in forces],
+            )
+            self._force_index_version = self._data_version
+        return self._force_index
+
+    def hit_test(self, x, y):
+        """
+        Текст подсказки для точки холста: сила F имеет приоритет перед нагрузкой q
+        Поиск ведётся делением пополам по координатам узлов
+        """
+        if len(self.bars) == 0:
+            return ""
+        offset, scale, y_axis = self.view_transform()
+        node_positions = self.bars.node_positions
+
+        # Сосредоточенные силы: область ±20 пикселей вокруг узла на уровне стрелки
+        yF = y_axis - 55
+        if abs(y - yF) <= 15:
+            positions, order, values = self.force_index()
+            lo = np.searchsorted(positions, (x - 20 - offset) / scale, side='left')
+            hi = np.searchsorted(positions, (x + 20 - offset) / scale, side='right')
+            if hi > lo:
+                # При совпадении областей, как и раньше, берётся сила, заданная последней
+                return f"F = {values[order[lo:hi].max()]}"
+
+        # Погонные нагрузки: стержень под курсором без отступов по 10 пикселей у узлов
+        yq = y_axis - 35
+        if abs(y - yq) <= 10:
+            idx = int(np.searchsorted(node_positions, (x - offset) / scale, side='right')) - 1
+            if 0 <= idx < len(self.bars):
+                q = float(self.bars.q[idx])
+                x1 = offset + node_positions[idx] * scale + 10
+                x2 = offset + node_positions[idx + 1] * scale - 10
+                if abs(q) >= 0.001 and x1 <= x <= x2:
+                    return f"q = {q}"
+        return ""
+
     def mouseMoveEvent(self, event):
         pos = event.pos()
-        self.hover_text = ""
-        for rect, val in getattr(self, "q_regions", []):
-            if rect.contains(pos):
-                self.hover_text = f"q = {val}"
-        for rect, val in getattr(self, "F_regions", []):
-            if rect.contains(pos):
-                self.hover_text = f"F = {val}"
+        self.hover_text = self.hit_test(pos.x(), pos.y())
         if self.hover_text:
             QToolTip.showText(event.globalPos(), self.hover_text, self)
         else:
@@ -49,65 +185,145 @@ class StructureCanvas(QWidget):
             factor = factor ** 2  # Быстрое масштабирование при зажатом Ctrl
         self.zoom_factor *= factor
         self.zoom_factor = max(0.2, min(5.0, self.zoom_factor))  # Ограничиваем диапазон зума
+        # Пока колесо крутится, готовый слой растягивается; перерисовка - после паузы
+        self._zoom_timer.start(self.ZOOM_SETTLE_MS)
         self.update()
 
+    def new_layer(self, fill):
+        """
+        Пустой слой размером с холст с учётом плотности пикселей экрана
+        """
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(fill)
+        return layer
+
+    def grid_layer(self):
+        """
+        Фон с сеткой; перестраивается только при изменении размера или видимости сетки
+        """
+        key = (self.width(), self.height(), self.devicePixelRatioF(), self.show_grid)
+        if self._grid_layer is None or self._grid_key != key:
+            layer = self.new_layer(QColor(230, 200, 150))
+            if self.show_grid:
+                painter = QPainter(layer)
+                painter.setRenderHint(QPainter.Antialiasing)
+                step = 20
+                painter.setPen(QPen(QColor(180,180,180),1,Qt.DotLine))
+                for x in range(0,self.width(),step):
+                    painter.drawLine(x,0,x,self.height())
+                for y in range(0,self.height(),step):
+                    painter.drawLine(0,y,self.width(),y)
+                painter.end()
+            self._grid_layer = layer
+            self._grid_key = key
+        return self._grid_layer
+
+    def geometry_layer(self):
+        """
+        Стержни, узлы, опоры и нагрузки; перестраиваются при изменении размера
+        или модели. Возвращает слой и масштаб, в котором он нарисован: при
+        масштабировании колесом слой не перерисовывается, пока колесо не
+        остановится, а растягивается при выводе в paintEvent
+        """
+        key = (self.width(), self.height(), self.devicePixelRatioF(), self._data_version)
+        zoom_stale = self._geometry_zoom != self.zoom_factor and not self._zoom_timer.isActive()
+        if self._geometry_layer is None or self._geometry_key != key or zoom_stale:
+            layer = self.new_layer(Qt.transparent)
+            painter = QPainter(layer)
+            self.draw_geometry(painter)
+            painter.end()
+            self._geometry_layer = layer
+            self._geometry_key = key
+            self._geometry_zoom = self.zoom_factor
+        return self._geometry_layer, self._geometry_zoom
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(230, 200, 150))
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        if self.show_grid:
-            step = 20
-            painter.setPen(QPen(QColor(180,180,180),1,Qt.DotLine))
-            for x in range(0,self.width(),step):
-                painter.drawLine(x,0,x,self.height())
-            for y in range(0,self.height(),step):
-                painter.drawLine(0,y,self.width(),y)
-
+        painter.drawPixmap(0, 0, self.grid_layer())
         if len(self.bars) == 0:
             return
-
-        node_positions = [0]
-        for bar in self.bars:
-            node_positions.append(node_positions[-1] + float(bar['L']))
-        total_length = node_positions[-1] if node_positions[-1]>0 else 10
-        base_scale = (self.width() - 100)/total_length
-        scale = base_scale * self.zoom_factor  # 🔹 применяем масштабирование
-        offset = 50
-        y_axis = self.height()//2
-
-        max_A = max([float(bar['A']) for bar in self.bars]+[1])
-        thickness_scale = 50/max_A
-
+        offset, _, y_axis = self.view_transform()
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setPen(QPen(Qt.black,2))
         painter.drawLine(0,y_axis,self.width(),y_axis)
 
-        # Стержни
-        for idx, bar in enumerate(self.bars):
-            x1 = offset + node_positions[idx]*scale
-            x2 = offset + node_positions[idx+1]*scale
-            y = y_axis
-            thickness = max(4,float(bar.get('A',1))*thickness_scale)
-            rect_top = y - thickness//2
-            rect_height = thickness
-            painter.setPen(QPen(Qt.black))
-            painter.setBrush(QBrush(QColor(100,50,0)))
-            painter.drawRect(int(x1), int(rect_top), int(x2-x1), int(rect_height))
-            painter.setPen(QPen(Qt.black))
-            painter.setBrush(QBrush(Qt.white))
-            painter.drawEllipse(int((x1+x2)/2)-6, int(rect_top+rect_height/2)-6, 12, 12)
-            painter.drawText(int((x1+x2)/2-3), int(rect_top+rect_height/2+5), str(idx+1))
-
-        # Узлы
+        layer, layer_zoom = self.geometry_layer()
+        if layer_zoom != self.zoom_factor:
+            # Слой нарисован в другом масштабе: растяжение по x относительно
+            # начала конструкции совпадает с view_transform для текущего масштаба
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.translate(offset, 0)
+            painter.scale(self.zoom_factor / layer_zoom, 1)
+            painter.translate(-offset, 0)
+        painter.drawPixmap(0, 0, layer)
+
+    def draw_geometry(self, painter):
+        """
+        Отрисовка модели с отсечением элементов вне видимой области холста
+        """
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        node_positions = self.bars.node_positions
+        offset, scale, y_axis = self.view_transform()
+
+        thickness_scale = 50/self.max_A
+
+        # Видимый диапазон стержней [first_bar, last_bar) по координатам узлов
+        n_bars = len(self.bars)
+        x_visible_min = (-self.CULL_MARGIN - offset) / scale
+        x_visible_max = (self.width() + self.CULL_MARGIN - offset) / scale
+        first_bar = max(int(np.searchsorted(node_positions, x_visible_min, side='right')) - 1, 0)
+        last_bar = min(int(np.searchsorted(node_positions, x_visible_max, side='left')), n_bars)
+
+        # Экранные координаты видимых узлов и размеры стержней считаются массивами
+        node_x_array = offset + node_positions[first_bar:last_bar + 1] * scale
+        thickness_array = np.maximum(4, self.bars.A[first_bar:last_bar] * thickness_scale)
+
+        # Стержни, начинающиеся в одном столбце пикселей, объединяются в один
+        # прямоугольник наибольшей толщины: при плотной модели рисуется не больше
+        # прямоугольников, чем столбцов пикселей
+        x1_array = node_x_array[:-1]
+        if len(x1_array):
+            columns = x1_array.astype(int)
+            starts = np.flatnonzero(np.r_[True, columns[1:] != columns[:-1]])
+            group_x1 = x1_array[starts]
+            group_x2 = np.maximum.reduceat(node_x_array[1:], starts)
+            group_thickness = np.maximum.reduceat(thickness_array, starts)
+        else:
+            group_x1 = group_x2 = group_thickness = x1_array
+
+        # Стержни одним пакетом
+        painter.setPen(QPen(Qt.black))
+        painter.setBrush(QBrush(QColor(100,50,0)))
+        painter.drawRects([
+            QRect(int(x1), int(y_axis - height//2), int(x2-x1), int(height))
+            for x1, x2, height in zip(group_x1.tolist(), group_x2.tolist(), group_thickness.tolist())
+        ])
+        # Номер стержня рисуется, только если помещается в стержень
+        painter.setBrush(QBrush(Qt.white))
+        for idx in np.flatnonzero(np.diff(node_x_array) >= 12).tolist():
+            x1, x2 = node_x_array[idx], node_x_array[idx + 1]
+            height = thickness_array[idx]
+            top = y_axis - height//2
+            painter.drawEllipse(int((x1+x2)/2)-6, int(top+height/2)-6, 12, 12)
+            painter.drawText(int((x1+x2)/2-3), int(top+height/2+5), str(first_bar+idx+1))
+
+        # Узлы: пунктир по одному на столбец пикселей, перекрывающиеся номера пропускаются
         rect_size = 15
+        painter.setPen(QPen(Qt.black,1,Qt.DotLine))
+        painter.drawLines([QLine(x, y_axis, x, y_axis-40) for x in np.unique(node_x_array.astype(int)).tolist()])
+        painter.setPen(QPen(Qt.black))
         painter.setBrush(QBrush(Qt.white))
-        for i,pos in enumerate(node_positions):
-            node_x = offset + pos*scale
-            painter.setPen(QPen(Qt.black,1,Qt.DotLine))
-            painter.drawLine(int(node_x),y_axis,int(node_x),y_axis-40)
-            painter.setPen(QPen(Qt.black))
-            painter.drawRect(int(node_x-rect_size/2),y_axis-55,rect_size,rect_size)
-            painter.drawText(int(node_x-rect_size/2),y_axis-55,rect_size,rect_size,Qt.AlignCenter,str(i+1))
+        last_label_x = None
+        for i in range(len(node_x_array)):
+            x = node_x_array[i]
+            if last_label_x is not None and x - last_label_x < rect_size:
+                continue
+            last_label_x = x
+            painter.drawRect(int(x-rect_size/2),y_axis-55,rect_size,rect_size)
+            painter.drawText(int(x-rect_size/2),y_axis-55,rect_size,rect_size,Qt.AlignCenter,str(first_bar+i+1))
 
         # Опоры
         line_height = 40
@@ -133,15 +349,16 @@ class StructureCanvas(QWidget):
         # Погонные нагрузки q
         painter.setPen(QPen(Qt.black, 4))
         painter.setFont(QFont("Arial", 12, QFont.Bold))
-        self.q_regions = []
         q_y_offset = 35
         edge_margin = 10
-        for idx, bar in enumerate(self.bars):
-            q = bar.get('q', 0)
-            if abs(q) < 0.001:
-                continue
+        q_values = self.bars.q
+        for idx in np.flatnonzero(np.abs(q_values[first_bar:last_bar]) >= 0.001) + first_bar:
+            q = float(q_values[idx])
             x1 = offset + node_positions[idx] * scale + edge_margin
             x2 = offset + node_positions[idx + 1] * scale - edge_margin
+            # На стержне, который уже отступов, нагрузке негде поместиться
+            if x2 <= x1:
+                continue
             yq = y_axis - q_y_offset
             step = 25
             arrow_len = 16
@@ -160,17 +377,15 @@ class StructureCanvas(QWidget):
                     painter.drawLine(current_x - arrow_len, yq, current_x - arrow_len + 5, yq + 4)
                     current_x -= step
             painter.drawText((x1 + x2) // 2 - 5, yq - 10, "q")
-            self.q_regions.append((QRectF(x1, yq - 10, x2 - x1, 20), q))
 
         # Сосредоточенные силы F
         painter.setPen(QPen(Qt.black, 5))
         painter.setFont(QFont("Arial", 12, QFont.Bold))
-        self.F_regions = []
         arrow_len = 14
         F_y_offset = 55
         for f in self.node_forces:
             node_idx = f['node']-1
-            if 0<=node_idx<len(node_positions):
+            if first_bar<=node_idx<=last_bar and 0<=node_idx<len(node_positions):
                 x_node = offset + node_positions[node_idx]*scale
                 yF = y_axis - F_y_offset
                 if f['F'] > 0:
@@ -182,12 +397,14 @@ class StructureCanvas(QWidget):
                     painter.drawLine(x_node - arrow_len, yF, x_node - arrow_len +4, yF-3)
                     painter.drawLine(x_node - arrow_len, yF, x_node - arrow_len +4, yF+3)
                 painter.drawText(x_node -5, yF - 10, "F")
-                self.F_regions.append((QRectF(x_node - 20, yF - 15, 40, 30), f['F']))
 
 # ------------------------
 # Главное окно
 # ------------------------
 class MainWindow(QMainWindow):
+    # Задержка проверки модели после последней правки, мс
+    VALIDATION_DELAY_MS = 50
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Препроцессор стержневой системы")
@@ -195,7 +412,7 @@ class MainWindow(QMainWindow):
         self.setStyleSheet("background-color: #d4b483;")
         self.statusBar().showMessage("Готово")
 
-        self.bars = []
+        self.bars = BarSet()
         self.supports = []
         self.node_forces = []
         
@@ -203,6 +420,10 @@ class MainWindow(QMainWindow):
         self.current_U = None
         self.N_coeffs = None
         self.U_coeffs = None
+        self.results = None
+        # Окно результатов создаётся при первом расчёте и затем обновляется на месте
+        self.results_dialog = None
+        self.calculation_worker = None
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -235,16 +456,17 @@ class MainWindow(QMainWindow):
             layout.addLayout(btn_layout)
             return frame
 
-        self.bar_table = QTableWidget(0,4)
-        self.bar_table.setHorizontalHeaderLabels(["L, м", "A, м²", "E, Па", "σ, Па"])
+        # Таблицы ввода хранят значения в массивах float64 (см. InputTableModel)
+        self.bar_table = QTableView()
+        self.bar_table.setModel(InputTableModel(["L, м", "A, м²", "E, Па", "σ, Па"], parent=self))
         self.bar_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-        self.node_table = QTableWidget(0,2)
-        self.node_table.setHorizontalHeaderLabels(["Номер узла", "F, Н"])
+        self.node_table = QTableView()
+        self.node_table.setModel(InputTableModel(["Номер узла", "F, Н"], integer_columns=(0,), parent=self))
         self.node_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-        self.bar_load_table = QTableWidget(0,2)
-        self.bar_load_table.setHorizontalHeaderLabels(["Номер стержня", "q, Н/м"])
+        self.bar_load_table = QTableView()
+        self.bar_load_table.setModel(InputTableModel(["Номер стержня", "q, Н/м"], integer_columns=(0,), parent=self))
         self.bar_load_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
         left_panel.addWidget(make_block("Стержни", self.bar_table))
@@ -278,6 +500,17 @@ class MainWindow(QMainWindow):
         self.calc_results_btn.clicked.connect(self.calculate_and_show_results)
         left_panel.addWidget(self.calc_results_btn)
 
+        # Отмена фонового расчёта (видна только во время расчёта)
+        self.cancel_calc_btn = QPushButton("✖ Отменить расчёт")
+        self.cancel_calc_btn.setStyleSheet("background-color: #d4b483; font-weight:bold; border:1px solid #888; padding:2px")
+        self.cancel_calc_btn.clicked.connect(self.cancel_calculation)
+        self.cancel_calc_btn.setToolTip("Расчёт остановится после текущего шага: решение системы не прерывается")
+        self.cancel_calc_btn.setVisible(False)
+        self.statusBar().addPermanentWidget(self.cancel_calc_btn)
+
+        # Поток расчёта создаётся заранее
+        calculation_pool()
+
         left_panel.addStretch()
 
         # Строка для отображения ошибок (внизу левой панели)
@@ -290,11 +523,20 @@ class MainWindow(QMainWindow):
         self.canvas = StructureCanvas(self.bars,self.supports,self.node_forces)
         right_panel.addWidget(self.canvas)
 
+        # Инкрементальная проверка: кэш разобранных строк каждой таблицы
+        # и изменённые строки
+        self._row_cache = {table: None for table in self.input_tables()}
+        self._dirty_rows = {table: set() for table in self.input_tables()}
+        self._valid_bar_rows = []
+        self._validation_timer = QTimer(self)
+        self._validation_timer.setSingleShot(True)
+        self._validation_timer.timeout.connect(self.flush_validation)
+
         # Сигналы
-        self.bar_table.cellChanged.connect(self.update_visual)
-        self.node_table.cellChanged.connect(self.update_visual)
-        self.bar_load_table.cellChanged.connect(self.update_visual)
-        self.supp_combo.currentIndexChanged.connect(self.update_visual)
+        for table in self.input_tables():
+            table.model().dataChanged.connect(
+                lambda top_left, bottom_right, roles, t=table: self.on_cells_changed(t, top_left, bottom_right, roles))
+        self.supp_combo.currentIndexChanged.connect(self.schedule_validation)
 
         # Меню
         menubar = self.menuBar()
@@ -313,36 +555,70 @@ class MainWindow(QMainWindow):
 
     def calculate_and_show_results(self):
         """Объединенная функция расчета и показа результатов"""
+        # Применяем правки, ожидающие отложенной проверки
+        self.flush_validation()
         if not self.bars:
             QMessageBox.warning(self, "Ошибка", "Нет данных для расчёта: отсутствуют стержни")
             return
         
-        try:
-            # Показываем сообщение о начале расчета
-            self.statusBar().showMessage("Выполняется расчёт...")
-            QApplication.processEvents()  # Обновляем интерфейс
-            
-            # Выполняем расчет
-            processor = RodStructureProcessor(self.bars, self.node_forces, self.supports)
-            delta = processor.solve()
-            
-            # Сохраняем результаты для постпроцессора
-            self.current_U = delta
-            self.N_coeffs = processor.calculate_internal_forces_coefficients(delta)
-            self.U_coeffs = processor.calculate_displacement_coefficients(delta)
-            
-            # Показываем успешное сообщение
-            self.statusBar().showMessage("Расчёт выполнен успешно")
-            
-            # Сразу открываем окно с результатами
-            self.show_results()
-            
-        except Exception as e:
-            self.statusBar().showMessage("Ошибка при расчёте")
-            QMessageBox.critical(self, "Ошибка расчёта", f"Не удалось выполнить расчёт:\n{str(e)}")
-            self.current_U = None
-            self.N_coeffs = None
-            self.U_coeffs = None
+        if self.calculation_worker is not None:
+            return
+        
+        # Показываем сообщение о начале расчета
+        self.statusBar().showMessage("Выполняется расчёт...")
+        
+        # Расчёт выполняется в фоновом потоке, окно остаётся отзывчивым
+        worker = CalculationWorker(self.bars, self.node_forces, self.supports)
+        worker.signals.progress.connect(self.on_calculation_progress)
+        worker.signals.finished.connect(self.on_calculation_finished)
+        worker.signals.failed.connect(self.on_calculation_failed)
+        worker.signals.cancelled.connect(self.on_calculation_cancelled)
+        self.calculation_worker = worker
+        self.calc_results_btn.setEnabled(False)
+        self.cancel_calc_btn.setVisible(True)
+        calculation_pool().start(worker)
+
+    def cancel_calculation(self):
+        """Отмена фонового расчёта (срабатывает после текущего шага расчёта)"""
+        if self.calculation_worker is not None:
+            self.calculation_worker.cancel()
+            self.statusBar().showMessage("Отмена расчёта: ожидание завершения текущего шага...")
+
+    def finish_calculation(self):
+        self.calculation_worker = None
+        self.calc_results_btn.setEnabled(True)
+        self.cancel_calc_btn.setVisible(False)
+
+    def on_calculation_progress(self, stage, n_stages, title):
+        self.statusBar().showMessage(f"Выполняется расчёт: этап {stage} из {n_stages} — {title}...")
+
+    def on_calculation_finished(self, results):
+        self.finish_calculation()
+        
+        # Сохраняем результаты для постпроцессора
+        self.results = results
+        self.current_U = results['U']
+        self.N_coeffs = results['N_coeffs']
+        self.U_coeffs = results['U_coeffs']
+        
+        # Показываем успешное сообщение
+        self.statusBar().showMessage("Расчёт выполнен успешно")
+        
+        # Сразу открываем окно с результатами
+        self.show_results()
+
+    def on_calculation_failed(self, message):
+        self.finish_calculation()
+        self.statusBar().showMessage("Ошибка при расчёте")
+        QMessageBox.critical(self, "Ошибка расчёта", f"Не удалось выполнить расчёт:\n{message}")
+        self.results = None
+        self.current_U = None
+        self.N_coeffs = None
+        self.U_coeffs = None
+
+    def on_calculation_cancelled(self):
+        self.finish_calculation()
+        self.statusBar().showMessage("Расчёт отменён")
 
     def show_results(self):
         """Показ модального окна с результатами"""
@@ -350,34 +626,54 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Ошибка", "Сначала выполните расчёт!")
             return
         
+        # Модель на момент расчёта и подготовленные в фоне эпюры
+        results = self.results or {}
+        
         try:
-            # Создаем и показываем модальное окно с результатами
-            results_dialog = ResultsDialog( 
-            self.bars, 
-            self.current_U, 
-            self.N_coeffs, 
-            self.U_coeffs, 
-            self,
-            self.supports,  # передаем опоры
-            self.node_forces  # передаем сосредоточенные силы
+            if self.results_dialog is None:
+                # Создаем модальное окно с результатами
+                self.results_dialog = ResultsDialog( 
+                results.get('bars', self.bars), 
+                self.current_U, 
+                self.N_coeffs, 
+                self.U_coeffs, 
+                self,
+                results.get('supports', self.supports),  # передаем опоры
+                results.get('node_forces', self.node_forces),  # передаем сосредоточенные силы
+                post=results.get('post')
 )
-            results_dialog.exec()
+            else:
+                # Повторный расчёт: окно и его эпюры обновляются на месте
+                self.results_dialog.update_results(
+                    self.current_U,
+                    self.N_coeffs,
+                    self.U_coeffs,
+                    bars=results.get('bars', self.bars),
+                    supports=results.get('supports', self.supports),
+                    node_forces=results.get('node_forces', self.node_forces),
+                    post=results.get('post'),
+                )
+            self.results_dialog.exec()
             
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Ошибка при отображении результатов: {e}")
 
     def add_row(self, table):
-        row = table.rowCount()
-        table.insertRow(row)
-        for i in range(table.columnCount()):
-            table.setItem(row,i,QTableWidgetItem(""))
-        self.update_visual()
+        row = table.model().rowCount()
+        table.model().insertRows(row, 1)
+        # Пустая строка в конце не сдвигает остальные: достаточно разобрать её одну
+        if self._row_cache[table] is not None:
+            self._row_cache[table].append(None)
+            self._dirty_rows[table].add(row)
+        self.schedule_validation()
 
     def delete_row(self, table):
         rows = table.selectionModel().selectedRows()
-        for r in reversed(rows):
-            table.removeRow(r.row())
-        self.update_visual()
+        for r in sorted((r.row() for r in rows), reverse=True):
+            table.model().removeRows(r, 1)
+        # Номера строк сдвинулись, таблица разбирается заново
+        self._row_cache[table] = None
+        self.schedule_validation()
 
     def toggle_grid(self):
         self.canvas.show_grid = not self.canvas.show_grid
@@ -386,7 +682,7 @@ class MainWindow(QMainWindow):
 
     def clear_all(self):
         for table in [self.bar_table, self.node_table, self.bar_load_table]:
-            table.setRowCount(0)
+            table.model().clear()
         self.supp_combo.setCurrentIndex(0)
     
         self.grid_action.setChecked(True)
@@ -395,17 +691,16 @@ class MainWindow(QMainWindow):
         self.error_label.setText("")
 
         # Обнуляем данные
-        self.bars = []
+        self.bars = BarSet()
         self.supports = []
         self.node_forces = []
         self.current_U = None
         self.N_coeffs = None
         self.U_coeffs = None
+        self.results = None
 
         # Обнуляем данные холста
-        self.canvas.bars = []
-        self.canvas.supports = []
-        self.canvas.node_forces = []
+        self.canvas.set_model(self.bars, [], [])
         self.canvas.zoom_factor = 1.0
         self.canvas.update()
 
@@ -415,156 +710,248 @@ class MainWindow(QMainWindow):
     # Обновление визуализации
     # ------------------------
     def update_visual(self):
-        self.bar_table.blockSignals(True)
-        self.node_table.blockSignals(True)
-        self.bar_load_table.blockSignals(True)
-
-        # Очистка подсветки
-        def clear_error_highlights(table):
-            for i in range(table.rowCount()):
-                for j in range(table.columnCount()):
-                    item = table.item(i, j)
-                    if item:
-                        item.setBackground(Qt.white)
-        def mark_error_cell(item):
-            if item:
-                item.setBackground(QColor(255, 180, 180))
-                item.setToolTip("Некорректное значение")
-
-        for t in [self.bar_table, self.node_table, self.bar_load_table]:
-            clear_error_highlights(t)
+        """
+        Полная проверка всех таблиц (после загрузки проекта и удаления строк)
+        """
+        for table in self.input_tables():
+            self._row_cache[table] = None
+        self.flush_validation()
+
+    def input_tables(self):
+        return [self.bar_table, self.node_table, self.bar_load_table]
+
+    def on_cells_changed(self, table, top_left, bottom_right, roles):
+        """
+        Правка ячеек: перечитываются только изменённые строки,
+        проверка модели и перерисовка холста откладываются до паузы во вводе
+        Изменение подсветки ошибок проверку не запускает
+        """
+        if roles and Qt.EditRole not in roles:
+            return
+        self._dirty_rows[table].update(range(top_left.row(), bottom_right.row() + 1))
+        self.schedule_validation()
+
+    def schedule_validation(self):
+        self._validation_timer.start(self.VALIDATION_DELAY_MS)
+
+    @staticmethod
+    def cell_text(table, row, col):
+        return table.model().text(row, col)
+
+    def parse_bar_row(self, i):
+        """
+        Разбор строки стержня: None для пустой строки,
+        иначе (значения L, A, E, sigma или None, ошибки, столбцы с ошибками)
+        """
+        invalid = None, [f"Стержень {i+1}: некорректные числовые данные"], [0, 1, 2, 3]
+        model = self.bar_table.model()
+        if model.has_texts(i):
+            texts = [self.cell_text(self.bar_table, i, j) for j in range(4)]
+            has_data = any(text and text.strip() for text in texts)
+            if not has_data:
+                return None
+
+            try:
+                L, A, E, sigma = (float(text.strip()) for text in texts)
+            except Exception:
+                return invalid
+        else:
+            # Строка без сохранённого текста: значения уже разобраны, NaN - пустая ячейка
+            values = model.row_values(i)
+            missing = [math.isnan(value) for value in values]
+            if all(missing):
+                return None
+            if any(missing):
+                return invalid
+            L, A, E, sigma = values
+
+        # 🔹 Дополнительные физические проверки
+        errors = []
+        marks = []
+        if L <= 0:
+            errors.append(f"Стержень {i+1}: длина должна быть > 0")
+            marks.append(0)
+        if A <= 0:
+            errors.append(f"Стержень {i+1}: площадь должна быть > 0")
+            marks.append(1)
+        if E <= 0:
+            errors.append(f"Стержень {i+1}: модуль упругости должен быть > 0")
+            marks.append(2)
+        if sigma <= 0:
+            errors.append(f"Стержень {i+1}: допускаемое напряжение должно быть > 0")
+            marks.append(3)
+        if errors:
+            return None, errors, marks
+        return (L, A, E, sigma), [], []
+
+    def parse_load_row(self, i):
+        """
+        Разбор строки погонной нагрузки: None для незаполненной строки,
+        (номер стержня с нуля, q) или (None, None) при некорректных данных
+        """
+        model = self.bar_load_table.model()
+        if not model.has_texts(i):
+            bar_val, q_val = model.row_values(i)
+            if math.isnan(bar_val) or math.isnan(q_val):
+                return None
+            return int(bar_val) - 1, q_val
+
+        bar_text = self.cell_text(self.bar_load_table, i, 0)
+        q_text = self.cell_text(self.bar_load_table, i, 1)
+        if not bar_text or not bar_text.strip():
+            return None
+        if not q_text or not q_text.strip():
+            return None
+        try:
+            return int(bar_text.strip()) - 1, float(q_text.strip())
+        except Exception:
+            return None, None
+
+    def parse_force_row(self, i):
+        """
+        Разбор строки сосредоточенной силы
+        Возвращает номер узла, если он записан цифрами (для проверки диапазона),
+        и None для незаполненной строки, ('error', текст) или (узел, F)
+        """
+        model = self.node_table.model()
+        if not model.has_texts(i):
+            node_val, F_val = model.row_values(i)
+            digit = int(node_val) if node_val >= 0 else None
+            if math.isnan(node_val) or math.isnan(F_val):
+                return digit, None
+            return digit, (int(node_val), F_val)
+
+        node_text = self.cell_text(self.node_table, i, 0)
+        F_text = self.cell_text(self.node_table, i, 1)
+        digit = int(node_text.strip()) if node_text and node_text.strip().isdigit() else None
+        if not node_text or not node_text.strip():
+            return digit, None
+        if not F_text or not F_text.strip():
+            return digit, None
+        try:
+            return digit, (int(node_text.strip()), float(F_text.strip()))
+        except Exception as e:
+            return digit, ('error', str(e))
+
+    def flush_validation(self):
+        """
+        Применение отложенных правок: разбор изменённых строк, сборка модели
+        из кэша разобранных строк, подсветка ошибок, холст и строка ошибок
+        """
+        self._validation_timer.stop()
+        parsers = {
+            self.bar_table: self.parse_bar_row,
+            self.node_table: self.parse_force_row,
+            self.bar_load_table: self.parse_load_row,
+        }
+        bars_changed = False
+        for table, parse in parsers.items():
+            cache = self._row_cache[table]
+            dirty = self._dirty_rows[table]
+            rows = table.model().rowCount()
+            if cache is None or len(cache) != rows:
+                # Полный разбор таблицы
+                self._row_cache[table] = [parse(i) for i in range(rows)]
+                bars_changed |= table is self.bar_table
+            else:
+                for i in dirty:
+                    if 0 <= i < len(cache):
+                        cache[i] = parse(i)
+                bars_changed |= table is self.bar_table and bool(dirty)
+            dirty.clear()
 
         errors = []
+        marks = {table: set() for table in parsers}
 
         # -----------------------
         # СТЕРЖНИ
         # -----------------------
-        self.bars = []
-        for i in range(self.bar_table.rowCount()):
-            L_item = self.bar_table.item(i, 0)
-            A_item = self.bar_table.item(i, 1)
-            E_item = self.bar_table.item(i, 2)
-            sigma_item = self.bar_table.item(i, 3)
-
-            has_data = any(item and item.text().strip() for item in [L_item, A_item, E_item, sigma_item])
-            if not has_data:
+        valid_rows = []
+        bar_values = []
+        for i, parsed in enumerate(self._row_cache[self.bar_table]):
+            if parsed is None:
                 continue
+            values, row_errors, row_marks = parsed
+            errors.extend(row_errors)
+            marks[self.bar_table].update((i, j) for j in row_marks)
+            if values is not None:
+                valid_rows.append(i)
+                bar_values.append(values)
+
+        bars_modified = False  # стержни изменены на месте
+        if bars_changed or valid_rows != self._valid_bar_rows:
+            columns = np.array(bar_values, dtype=float).reshape(-1, 4)
+            if valid_rows == self._valid_bar_rows and len(self.bars) == len(columns):
+                # Набор стержней прежний: столбцы обновляются на месте
+                for j, field in enumerate(('L', 'A', 'E', 'sigma')):
+                    changed = np.flatnonzero(getattr(self.bars, field) != columns[:, j])
+                    for k in changed.tolist():
+                        self.bars.set_value(k, field, columns[k, j])
+                    bars_modified |= len(changed) > 0
+            else:
+                self.bars = BarSet(*columns.T)
+            self._valid_bar_rows = valid_rows
 
-            try:
-                L = float(L_item.text().strip())
-                A = float(A_item.text().strip())
-                E = float(E_item.text().strip())
-                sigma = float(sigma_item.text().strip())
-            except Exception:
-                errors.append(f"Стержень {i+1}: некорректные числовые данные")
-                for item in [L_item, A_item, E_item, sigma_item]:
-                    mark_error_cell(item)
-                continue
-
-             # 🔹 Дополнительные физические проверки
-            valid = True
-            if L <= 0:
-                errors.append(f"Стержень {i+1}: длина должна быть > 0")
-                mark_error_cell(L_item)
-                valid = False
-            if A <= 0:
-                errors.append(f"Стержень {i+1}: площадь должна быть > 0")
-                mark_error_cell(A_item)
-                valid = False
-            if E <= 0:
-                errors.append(f"Стержень {i+1}: модуль упругости должен быть > 0")
-                mark_error_cell(E_item)
-                valid = False
-            if sigma <= 0:
-                errors.append(f"Стержень {i+1}: допускаемое напряжение должно быть > 0")
-                mark_error_cell(sigma_item)
-                valid = False 
-            if not valid:
-                continue
-
-            self.bars.append({'L': L, 'A': A, 'E': E, 'sigma': sigma, 'q': 0.0})
-
-        if self.bar_load_table.rowCount() > len(self.bars):
+        if self.bar_load_table.model().rowCount() > len(self.bars):
             errors.append("⚠️ Количество погонных нагрузок больше числа стержней")
 
         max_node = len(self.bars) + 1
-        for i in range(self.node_table.rowCount()):
-            node_item = self.node_table.item(i, 0)
-            if node_item and node_item.text().strip().isdigit():
-                node_idx = int(node_item.text().strip())
-                if node_idx < 1 or node_idx > max_node:
-                    errors.append(f"⚠️ Узел {node_idx} вне диапазона (1..{max_node})")
+        for digit, _ in self._row_cache[self.node_table]:
+            if digit is not None and (digit < 1 or digit > max_node):
+                errors.append(f"⚠️ Узел {digit} вне диапазона (1..{max_node})")
 
         # -----------------------
         # ПОГОННЫЕ НАГРУЗКИ
         # -----------------------
-        for bar in self.bars:
-            bar['q'] = 0.0
-
+        q = np.zeros(len(self.bars), dtype=float)
         assigned_bars = set()
-
-        for i in range(self.bar_load_table.rowCount()):
-            item_bar = self.bar_load_table.item(i, 0)
-            item_q = self.bar_load_table.item(i, 1)
-            if not item_bar or not item_bar.text().strip():
-                continue
-            if not item_q or not item_q.text().strip():
+        for i, parsed in enumerate(self._row_cache[self.bar_load_table]):
+            if parsed is None:
                 continue
-            try:
-                bar_idx = int(item_bar.text().strip()) - 1
-                q_val = float(item_q.text().strip())
-                if bar_idx < 0 or bar_idx >= len(self.bars):
-                    raise ValueError("номер стержня вне диапазона")
-                bar_idx = int(item_bar.text().strip()) - 1
-                if bar_idx in assigned_bars:
-                    errors.append(f"Стержень {bar_idx+1}: погонная нагрузка уже задана")
-                    mark_error_cell(item_bar)
-                    mark_error_cell(item_q)
-                    continue
-                assigned_bars.add(bar_idx)
-                self.bars[bar_idx]['q'] = q_val
-                if abs(q_val) < 0.001:
-                    errors.append(f"Стержень {bar_idx+1}: погонная нагрузка q = 0")
-                    mark_error_cell(item_q)
-                    continue 
-            except Exception:
+            bar_idx, q_val = parsed
+            if bar_idx is None or bar_idx < 0 or bar_idx >= len(self.bars):
                 errors.append(f"Погонная нагрузка {i+1}: некорректные данные")
-                mark_error_cell(item_bar)
-                mark_error_cell(item_q)
+                marks[self.bar_load_table].update({(i, 0), (i, 1)})
                 continue
+            if bar_idx in assigned_bars:
+                errors.append(f"Стержень {bar_idx+1}: погонная нагрузка уже задана")
+                marks[self.bar_load_table].update({(i, 0), (i, 1)})
+                continue
+            assigned_bars.add(bar_idx)
+            q[bar_idx] = q_val
+            if abs(q_val) < 0.001:
+                errors.append(f"Стержень {bar_idx+1}: погонная нагрузка q = 0")
+                marks[self.bar_load_table].add((i, 1))
+        if not np.array_equal(self.bars.q, q):
+            self.bars.q[:] = q
+            bars_modified = True
 
         # -----------------------
         # СОСРЕДОТОЧЕННЫЕ СИЛЫ
         # -----------------------
         self.node_forces = []
         occupied_nodes = set()
-        max_node = len(self.bars) + 1
-        for i in range(self.node_table.rowCount()):
-            item_node = self.node_table.item(i, 0)
-            item_F = self.node_table.item(i, 1)
-            if not item_node or not item_node.text().strip():
+        for i, (_, parsed) in enumerate(self._row_cache[self.node_table]):
+            if parsed is None:
                 continue
-            if not item_F or not item_F.text().strip():
-                continue
-            try:
-                node_idx = int(item_node.text().strip())
-                F_val = float(item_F.text().strip())
+            if parsed[0] == 'error':
+                message = parsed[1]
+            else:
+                node_idx, F_val = parsed
                 if node_idx < 1 or node_idx > len(self.bars) + 1:
-                    raise ValueError("номер узла вне диапазона")
-                if node_idx in occupied_nodes:
-                    raise ValueError(f"узел {node_idx} уже имеет сосредоточенную силу")
-                if abs(F_val) < 0.001:
+                    message = "номер узла вне диапазона"
+                elif node_idx in occupied_nodes:
+                    message = f"узел {node_idx} уже имеет сосредоточенную силу"
+                elif abs(F_val) < 0.001:
                     errors.append(f"Узел {node_idx}: сосредоточенная сила F = 0")
-                    mark_error_cell(item_F)
+                    marks[self.node_table].add((i, 1))
                     continue
-
-                self.node_forces.append({'node': node_idx, 'F': F_val})
-                occupied_nodes.add(node_idx)
-            except Exception as e:
-                errors.append(f"Сила {i+1}: {e}")
-                mark_error_cell(item_node)
-                mark_error_cell(item_F)
-                continue
+                else:
+                    self.node_forces.append({'node': node_idx, 'F': F_val})
+                    occupied_nodes.add(node_idx)
+                    continue
+            errors.append(f"Сила {i+1}: {message}")
+            marks[self.node_table].update({(i, 0), (i, 1)})
 
         # -----------------------
         # ОПОРЫ
@@ -574,24 +961,25 @@ class MainWindow(QMainWindow):
         if side != "Не выбрано":
             self.supports.append({'side': side})
 
+        # -----------------------
+        # ПОДСВЕТКА ОШИБОК
+        # -----------------------
+        for table, table_marks in marks.items():
+            self.apply_error_highlights(table, table_marks)
+
         # -----------------------
         # ОБНОВЛЕНИЕ ХОЛСТА
         # -----------------------
-        self.canvas.bars = self.bars
-        self.canvas.supports = self.supports
-        self.canvas.node_forces = self.node_forces
-        self.canvas.update()
+        # Кэш холста сбрасывается, только если модель действительно изменилась:
+        # правка текста ячейки без изменения значения не перерисовывает геометрию
+        if bars_modified and self.canvas.bars is self.bars:
+            self.canvas.invalidate()
+        self.canvas.set_model(self.bars, self.supports, self.node_forces)
 
         # Проверка на наличие стержней
         if not self.bars:
             errors.append("Не задано ни одного стержня")
 
-        # Проверка узлов для сосредоточенных сил
-        max_node = len(self.bars) + 1
-        for nf in self.node_forces:
-            if nf['node'] < 1 or nf['node'] > max_node:
-                errors.append(f"Сила задана в несуществующем узле {nf['node']}")
-
         # -----------------------
         # ОТОБРАЖЕНИЕ ОШИБОК
         # -----------------------
@@ -600,10 +988,12 @@ class MainWindow(QMainWindow):
         else:
             self.error_label.setText("")
 
-        # Включаем сигналы обратно
-        self.bar_table.blockSignals(False)
-        self.node_table.blockSignals(False)
-        self.bar_load_table.blockSignals(False)
+    def apply_error_highlights(self, table, marks):
+        """
+        Подсветка ячеек с ошибками: модель обновляет только ячейки,
+        у которых изменилось состояние
+        """
+        table.model().set_errors(marks)
 
     # ------------------------
     # Восстановление масштаба
@@ -622,8 +1012,11 @@ class MainWindow(QMainWindow):
         if not path:
             return
 
+        # Сохраняем модель с учётом правок, ожидающих проверки
+        self.flush_validation()
+
         project_data = {
-            "bars": self.bars,
+            "bars": self.bars.to_dicts(),
             "supports": self.supports,
             "node_forces": self.node_forces,
             "show_grid": self.grid_action.isChecked(),  # 🔹 исправлено
@@ -649,16 +1042,6 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Ошибка", f"Не удалось загрузить проект:\n{e}")
             return
         
-        # --- БЛОКИРУЕМ СИГНАЛЫ ---
-        self.bar_table.blockSignals(True)
-        self.node_table.blockSignals(True)
-        self.bar_load_table.blockSignals(True)
-            
-        # --- ОЧИЩАЕМ ТАБЛИЦЫ ---
-        self.bar_table.setRowCount(0)
-        self.node_table.setRowCount(0)
-        self.bar_load_table.setRowCount(0)
-
         # --- ЗАГРУЖАЕМ ДАННЫЕ ИЗ ФАЙЛА ---
         loaded_bars = project_data.get("bars", [])
         loaded_supports = project_data.get("supports", [])
@@ -670,38 +1053,29 @@ class MainWindow(QMainWindow):
         print(f"Загружено опор: {len(loaded_supports)}")
         print(f"Загружено сил: {len(loaded_node_forces)}")
 
-        # --- ЗАПОЛНЯЕМ ТАБЛИЦУ СТЕРЖНЕЙ ---
-        for bar in loaded_bars:
-            row = self.bar_table.rowCount()
-            self.bar_table.insertRow(row)
-            # Заполняем все 4 колонки: L, A, E, sigma
-            self.bar_table.setItem(row, 0, QTableWidgetItem(str(bar.get('L', ''))))
-            self.bar_table.setItem(row, 1, QTableWidgetItem(str(bar.get('A', ''))))
-            self.bar_table.setItem(row, 2, QTableWidgetItem(str(bar.get('E', ''))))
-            self.bar_table.setItem(row, 3, QTableWidgetItem(str(bar.get('sigma', ''))))
-
-       # Заполняем таблицу сосредоточенных сил
-        for nf in loaded_node_forces:
-            row = self.node_table.rowCount()
-            self.node_table.insertRow(row)
-            self.node_table.setItem(row, 0, QTableWidgetItem(str(nf.get("node", ""))))
-            self.node_table.setItem(row, 1, QTableWidgetItem(str(nf.get("F", ""))))
-        
-        self.node_forces = loaded_node_forces
-        self.canvas.node_forces = self.node_forces
-        self.canvas.update()
-
-        # Заполняем таблицу погонных нагрузок
-        for i, bar in enumerate(loaded_bars):
-            q_val = bar.get("q", 0)
-            if abs(q_val) > 0.001:
-                row = self.bar_load_table.rowCount()
-                self.bar_load_table.insertRow(row)
-                self.bar_load_table.setItem(row, 0, QTableWidgetItem(str(i + 1)))
-                self.bar_load_table.setItem(row, 1, QTableWidgetItem(str(q_val)))
-        
-        self.bars = loaded_bars
-        self.canvas.bars = self.bars
+        # --- ЗАПОЛНЯЕМ ТАБЛИЦЫ: ОДНА ЗАМЕНА ДАННЫХ НА ТАБЛИЦУ ---
+        # Таблица стержней: все 4 колонки L, A, E, sigma
+        self.bar_table.model().reset([
+            [bar.get(field, '') for bar in loaded_bars] for field in ('L', 'A', 'E', 'sigma')
+        ])
+
+        # Таблица сосредоточенных сил
+        self.node_table.model().reset([
+            [nf.get("node", "") for nf in loaded_node_forces],
+            [nf.get("F", "") for nf in loaded_node_forces],
+        ])
+
+        # Таблица погонных нагрузок
+        loads = [(i + 1, bar.get("q", 0)) for i, bar in enumerate(loaded_bars)]
+        # Нечисловые значения переносятся в таблицу как есть и подсвечиваются проверкой
+        loads = [
+            (i, q_val) for i, q_val in loads
+            if not isinstance(q_val, (int, float)) or abs(q_val) > 0.001
+        ]
+        self.bar_load_table.model().reset([
+            [i for i, _ in loads],
+            [q_val for _, q_val in loads],
+        ])
 
         # Восстанавливаем настройку сетки
         show_grid = project_data.get("show_grid", True)
@@ -714,26 +1088,14 @@ class MainWindow(QMainWindow):
         # Обновляем данные опор в памяти
         self.supports = loaded_supports
 
-        # Обновляем холст
-        self.canvas.supports = self.supports
-        self.canvas.update()
-
-        # --- РАЗБЛОКИРУЕМ СИГНАЛЫ ---
-        self.bar_table.blockSignals(False)
-        self.node_table.blockSignals(False)
-        self.bar_load_table.blockSignals(False)
-        
         # --- ОБНОВЛЯЕМ ДАННЫЕ В ПАМЯТИ ---
-        self.bars = loaded_bars
-        self.supports = loaded_supports
-        self.node_forces = loaded_node_forces
+        # Стержни, силы и опоры собираются в update_visual из проверенных строк
+        # таблиц: некорректные значения из файла подсвечиваются, а не прерывают загрузку
+        self.bars = BarSet()
+        self._valid_bar_rows = []
 
         # --- ОБНОВЛЯЕМ ХОЛСТ ---
-        self.canvas.bars = self.bars
-        self.canvas.supports = self.supports
-        self.canvas.node_forces = self.node_forces
         self.canvas.zoom_factor = 1.0  # Сбрасываем масштаб
-        self.canvas.update()
 
         # Обновляем визуализацию после того, как все таблицы заполнены
         self.update_visual()
@@ -0,0 +1,100 @@
+# montecarlo.py
+import numpy as np
+from barset import BarSet
+from processor import RodStructureProcessor, node_forces_to_array, evaluate_batch
+
+
+class MonteCarloAnalysis:
+    """
+    Статистический анализ НДС при случайных L, A, E и нагрузках
+    Выборка хранится двумерными массивами (образцы × стержни),
+    все трёхдиагональные системы пачки собираются и решаются сразу
+    """
+    # Положительные параметры моделируются логнормальным законом, нагрузки - нормальным
+    LOGNORMAL_FIELDS = ('L', 'A', 'E')
+    NORMAL_FIELDS = ('q', 'F')
+
+    def __init__(self, bars, node_forces, supports):
+        self.bars = BarSet.coerce(bars)
+        self.node_forces = node_forces
+        self.supports = supports
+
+        processor = RodStructureProcessor(self.bars, node_forces, supports)
+        self.n_nodes = processor.n_nodes
+        self.fixed, self.support_values = processor.get_fixed_dofs()
+        self.node_loads = node_forces_to_array(node_forces, self.n_nodes)
+
+    def sample(self, n_samples, variations, rng):
+        """
+        Генерация выборки
+        variations - словарь {'L' | 'A' | 'E' | 'q' | 'F': коэффициент вариации}
+        Средние значения берутся из исходной модели.
+        Возвращает массивы L, A, E, q (n_samples, n_bars) и узловые силы (n_samples, n_nodes)
+        """
+        for field in variations:
+            if field not in self.LOGNORMAL_FIELDS + self.NORMAL_FIELDS:
+                raise ValueError(f"Недопустимая случайная величина '{field}'")
+
+        means = {
+            'L': self.bars.L, 'A': self.bars.A, 'E': self.bars.E,
+            'q': self.bars.q, 'F': self.node_loads,
+        }
+        samples = {}
+        for field, mean in means.items():
+            cov = variations.get(field, 0.0)
+            shape = (n_samples, len(mean))
+            if not cov:
+                samples[field] = np.broadcast_to(mean, shape)
+            elif field in self.LOGNORMAL_FIELDS:
+                # Параметры логнормального закона с заданными средним и вариацией
+                s2 = np.log1p(cov**2)
+                mu = np.log(mean) - s2 / 2
+                samples[field] = np.exp(mu + np.sqrt(s2) * rng.standard_normal(shape))
+            else:
+                samples[field] = mean + cov * np.abs(mean) * rng.standard_normal(shape)
+
+        return samples['L'], samples['A'], samples['E'], samples['q'], samples['F']
+
+    def _evaluate_batch(self, L, A, E, q, node_loads):
+        """
+        Решение пачки конструкций
+        Возвращает узловые перемещения, наибольшие |σx| по стержням и |Ux| по конструкции
+        """
+        return evaluate_batch(L, A, E, q, node_loads, self.fixed, self.support_values)
+
+    def run(self, n_samples, variations, percentiles=(5, 50, 95), seed=None, batch_size=10000):
+        """
+        Расчёт n_samples случайных конструкций пачками по batch_size
+        Возвращает словарь:
+        percentiles - уровни процентилей,
+        sigma_max - процентили наибольшего |σx| по стержням (n_percentiles, n_bars),
+        U - процентили узловых перемещений (n_percentiles, n_nodes),
+        max_Ux - процентили наибольшего |Ux| по конструкции,
+        failure_probability - вероятность превышения sigma по каждому стержню,
+        system_failure_probability - вероятность отказа хотя бы одного стержня
+        """
+        rng = np.random.default_rng(seed)
+        n_bars = len(self.bars)
+
+        U_all = np.empty((n_samples, self.n_nodes), dtype=float)
+        sigma_all = np.empty((n_samples, n_bars), dtype=float)
+        max_Ux_all = np.empty(n_samples, dtype=float)
+
+        for start in range(0, n_samples, batch_size):
+            stop = min(start + batch_size, n_samples)
+            L, A, E, q, node_loads = self.sample(stop - start, variations, rng)
+            U_all[start:stop], sigma_all[start:stop], max_Ux_all[start:stop] = \
+                self._evaluate_batch(L, A, E, q, node_loads)
+
+        failed = sigma_all > self.bars.sigma
+        percentiles = np.asarray(percentiles, dtype=float)
+
+        return {
+            'n_samples': n_samples,
+            'percentiles': percentiles,
+            'sigma_max': np.percentile(sigma_all, percentiles, axis=0),
+            'U': np.percentile(U_all, percentiles, axis=0),
+            'max_Ux': np.percentile(max_Ux_all, percentiles),
+            'failure_probability': failed.mean(axis=0),
+            'system_failure_probability': float(failed.any(axis=1).mean()),
+        }
@@ -2,85 +2,400 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 from PySide6.QtWidgets import QFileDialog, QMessageBox
+from matplotlib.collections import LineCollection
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from barset import BarSet
 import matplotlib
 matplotlib.use('QtAgg')
 
 class PostProcessor:
+    # Допустимое отклонение хорды от параболы Ux в долях наибольшего |Ux|
+    EPURE_TOLERANCE = 1e-3
+    # Ограничение числа отрезков эпюры Ux на один стержень
+    EPURE_MAX_SEGMENTS = 256
+    # Наибольшее число стержней, подписываемых на совмещённых эпюрах
+    MAX_BAR_LABELS = 40
+    # Шаг детальной таблицы по умолчанию, м
+    DETAIL_STEP = 0.1
+    # Наибольшее число строк детальной таблицы, вычисляемых за один раз при записи в файл
+    DETAIL_CHUNK_ROWS = 200000
+    # Наибольшее число точек детальной таблицы на одном стержне (номер точки точен в float64)
+    MAX_DETAIL_POINTS = 2**53
+
     def __init__(self, kernels, N, U):
         """
         Инициализация постпроцессора
-        kernels - список стержней
-        N - коэффициенты для продольных сил
-        U - коэффициенты для перемещений
+        kernels - стержни (BarSet или список словарей)
+        N - коэффициенты для продольных сил, массив (n_bars, 2)
+        U - коэффициенты для перемещений, массив (n_bars, 3)
+        Таблица результатов и экстремумы кэшируются и сбрасываются
+        при замене стержней, коэффициентов или числа точек на стержень.
+        Стержни и коэффициенты копируются, поэтому изменения исходных
+        объектов на месте не делают кэш устаревшим
         """
+        self._points_per_bar = 8
         self.kernels = kernels
         self.N = N
         self.U = U
-        self.total_length = sum(kernel['L'] for kernel in kernels)
+
+    def invalidate(self):
+        """
+        Сброс кэшированных результатов
+        """
+        self._results_table = None
+        self._extrema = None
+        self._epures = {}
+        self._end_values = None
+
+    @property
+    def kernels(self):
+        return self._kernels
+
+    @kernels.setter
+    def kernels(self, value):
+        self._kernels = BarSet.coerce(value).copy()
+        self.invalidate()
+
+    @property
+    def N(self):
+        return self._N
+
+    @N.setter
+    def N(self, value):
+        self._N = np.array(value, dtype=float).reshape(-1, 2)
+        self.invalidate()
+
+    @property
+    def U(self):
+        return self._U
+
+    @U.setter
+    def U(self, value):
+        self._U = np.array(value, dtype=float).reshape(-1, 3)
+        self.invalidate()
+
+    @property
+    def points_per_bar(self):
+        """
+        Число точек на стержень в таблице результатов
+        """
+        return self._points_per_bar
+
+    @points_per_bar.setter
+    def points_per_bar(self, value):
+        if value != self._points_per_bar:
+            self._points_per_bar = value
+            self.invalidate()
+
+    @property
+    def total_length(self):
+        return self.kernels.total_length
+
+    @property
+    def node_positions(self):
+        """
+        Координаты узлов (префиксные суммы длин) для поиска стержня по сечению
+        """
+        return self.kernels.node_positions
+
+    def evaluate_sections(self, x_global):
+        """
+        Пакетный расчёт компонент НДС в массиве сечений
+        x_global - массив глобальных координат
+        Возвращает массивы: номер элемента (с единицы, 0 - сечение вне конструкции),
+        локальная координата, Nx, σx, Ux (NaN для сечений вне конструкции)
+        """
+        x_global = np.asarray(x_global, dtype=float)
+        n_bars = len(self.kernels)
+
+        i = np.searchsorted(self.node_positions[1:], x_global, side='left')
+        outside = i >= n_bars
+        if n_bars == 0:
+            nan = np.full(x_global.shape, np.nan)
+            return np.zeros(x_global.shape, dtype=int), nan, nan.copy(), nan.copy(), nan.copy()
+        i = np.minimum(i, n_bars - 1)
+
+        x_local = x_global - self.node_positions[i]
+        N = self.N[i]
+        U = self.U[i]
+        Nx = N[..., 0] + x_local * N[..., 1]
+        sigma_x = Nx / self.kernels.A[i]
+        Ux = U[..., 0] + x_local * U[..., 1] + (x_local**2) * U[..., 2]
+
+        if outside.any():
+            for values in (x_local, Nx, sigma_x, Ux):
+                values[outside] = np.nan
+        element = np.where(outside, 0, i + 1)
+
+        return element, x_local, Nx, sigma_x, Ux
         
     def calculate_section_results(self, x_global):
         """
         Расчёт всех компонент НДС в конкретном сечении
         Возвращает словарь с значениями
         """
-        x_current = 0
-        for i, kernel in enumerate(self.kernels):
-            if x_global <= x_current + kernel['L']:
-                x_local = x_global - x_current
-                
-                # Расчёт Nx
-                Nx = self.N[i][0] + x_local * self.N[i][1]
-                
-                # Расчёт σx
-                sigma_x = Nx / kernel['A']
-                
-                # Расчёт Ux
-                Ux = self.U[i][0] + x_local * self.U[i][1] + (x_local**2) * self.U[i][2]
-                
-                return {
-                    'position': round(x_global, 4),
-                    'Nx': round(Nx, 4),
-                    'sigma_x': round(sigma_x, 4),
-                    'Ux': round(Ux, 4),
-                    'element': i+1
-                }
-            x_current += kernel['L']
+        element, _, Nx, sigma_x, Ux = self.evaluate_sections([x_global])
+        if element[0] == 0:
+            return None
         
-        return None
+        return {
+            'position': round(x_global, 4),
+            'Nx': round(float(Nx[0]), 4),
+            'sigma_x': round(float(sigma_x[0]), 4),
+            'Ux': round(float(Ux[0]), 4),
+            'element': int(element[0])
+        }
+
+    def bar_end_values(self):
+        """
+        Значения Nx, σx, Ux в начале и конце каждого стержня
+        Словарь массивов (n_bars, 2); вычисляется один раз до сброса кэша
+        """
+        if self._end_values is not None:
+            return self._end_values
+
+        L = self.kernels.L
+        Nx = np.stack([self.N[:, 0], self.N[:, 0] + L * self.N[:, 1]], axis=1)
+        Ux = np.stack([
+            self.U[:, 0],
+            self.U[:, 0] + L * self.U[:, 1] + (L**2) * self.U[:, 2]
+        ], axis=1)
+
+        self._end_values = {
+            'Nx': Nx,
+            'σx': Nx / self.kernels.A[:, None],
+            'Ux': Ux,
+        }
+        return self._end_values
 
     def create_results_table(self):
         """
         Создание общей таблицы результатов
+        Таблица строится один раз и кэшируется; возвращаемый DataFrame не изменять
         """
-        results = []
+        if self._results_table is not None:
+            return self._results_table
+
+        # points_per_bar точек на каждый стержень, как np.linspace(0, L, points) для всех стержней сразу
+        points = self.points_per_bar
+        L = self.kernels.L[:, None]
+        x_local = np.arange(points) * (L / (points - 1))
+        x_local[:, -1] = L[:, 0]
+        x_global = self.node_positions[:-1, None] + x_local
         
-        for i, kernel in enumerate(self.kernels):
-            # 8 точек на каждый стержень
-            x_points = np.linspace(0, kernel['L'], 8)
-            
-            for x_local in x_points:
-                x_global = sum(kernel['L'] for kernel in self.kernels[:i]) + x_local
-                
-                Nx = self.N[i][0] + x_local * self.N[i][1]
-                sigma_x = Nx / kernel['A']
-                Ux = self.U[i][0] + x_local * self.U[i][1] + (x_local**2) * self.U[i][2]
-                
-                results.append([
-                    round(x_global, 4),
-                    i + 1,
-                    round(x_local, 4),
-                    round(Nx, 4),
-                    round(sigma_x, 4),
-                    round(Ux, 4)
-                ])
+        Nx = self.N[:, [0]] + x_local * self.N[:, [1]]
+        sigma_x = Nx / self.kernels.A[:, None]
+        Ux = self.U[:, [0]] + x_local * self.U[:, [1]] + (x_local**2) * self.U[:, [2]]
         
-        df = pd.DataFrame(results, columns=[
-            'Глобальная координата', 'Элемент', 'Локальная координата',
-            'Nx', 'σx', 'Ux'
-        ])
+        df = pd.DataFrame({
+            'Глобальная координата': np.round(x_global, 4).ravel(),
+            'Элемент': np.repeat(np.arange(1, len(self.kernels) + 1), points),
+            'Локальная координата': np.round(x_local, 4).ravel(),
+            'Nx': np.round(Nx, 4).ravel(),
+            'σx': np.round(sigma_x, 4).ravel(),
+            'Ux': np.round(Ux, 4).ravel()
+        })
         
+        self._results_table = df
         return df
 
+    @classmethod
+    def validate_sampling(cls, step=None, points=None):
+        """
+        Проверка шага step или числа точек points детальной таблицы
+        Некорректное значение - ValueError с текстом для пользователя
+        """
+        if points is not None:
+            if points < 2:
+                raise ValueError("Число точек на стержень должно быть не меньше 2")
+            if points > cls.MAX_DETAIL_POINTS:
+                raise ValueError(f"Число точек на стержень должно быть не больше {cls.MAX_DETAIL_POINTS}")
+            return
+        step = cls.DETAIL_STEP if step is None else float(step)
+        if not step > 0:
+            raise ValueError("Шаг детальной таблицы должен быть > 0")
+
+    def detailed_counts(self, step=None, points=None, bars=None):
+        """
+        Число точек детальной таблицы на стержнях
+        step - шаг по длине: точки 0, step, 2·step, ... меньше L и конец стержня
+        points - число равномерно расположенных точек на стержень (вместо шага)
+        bars - номера стержней (с нуля), по умолчанию все
+        """
+        self.validate_sampling(step, points)
+        L = self.kernels.L if bars is None else self.kernels.L[bars]
+        if points is not None:
+            return np.full(len(L), int(points), dtype=np.int64)
+
+        step = self.DETAIL_STEP if step is None else float(step)
+        intervals = L / step
+        if np.any(intervals >= self.MAX_DETAIL_POINTS):
+            raise ValueError(f"Слишком мелкий шаг: больше {self.MAX_DETAIL_POINTS} точек на стержне")
+        # Число точек k·step < L; ceil уточняется из-за погрешности деления
+        inner = np.ceil(intervals).astype(np.int64)
+        inner = np.where((inner - 1) * step >= L, inner - 1, inner)
+        inner = np.where(inner * step < L, inner + 1, inner)
+        return np.maximum(inner, 1) + 1
+
+    def detailed_samples(self, bars=None, step=None, points=None):
+        """
+        Детальная таблица для стержней bars (номера с нуля, по умолчанию все)
+        с шагом step или числом точек points на стержень
+        Все точки считаются сразу; возвращает словарь плоских массивов:
+        element (с единицы), index (номер точки на стержне), x_local, x_global, Nx, σx, Ux
+        """
+        bars = np.arange(len(self.kernels)) if bars is None else np.asarray(bars, dtype=np.int64).ravel()
+        counts = self.detailed_counts(step, points, bars)
+
+        starts = np.cumsum(counts) - counts
+        index = np.arange(counts.sum()) - np.repeat(starts, counts)
+        return self._samples_at(np.repeat(bars, counts), index, np.repeat(counts, counts), step, points)
+
+    def _samples_at(self, bar, index, count, step=None, points=None):
+        """
+        Строки детальной таблицы по номерам стержней bar и номерам точек index
+        count - число точек на стержне каждой строки (последняя точка - конец стержня)
+        """
+        L = self.kernels.L[bar]
+        if points is not None:
+            x_local = index * (L / (points - 1))
+        else:
+            x_local = index * (self.DETAIL_STEP if step is None else float(step))
+        # Последняя точка каждого стержня - точно его конец
+        last = index == count - 1
+        x_local[last] = L[last]
+
+        Nx = self.N[bar, 0] + x_local * self.N[bar, 1]
+        Ux = self.U[bar, 0] + x_local * self.U[bar, 1] + (x_local**2) * self.U[bar, 2]
+        return {
+            'element': bar + 1,
+            'index': index,
+            'x_local': x_local,
+            'x_global': self.node_positions[bar] + x_local,
+            'Nx': Nx,
+            'σx': Nx / self.kernels.A[bar],
+            'Ux': Ux,
+        }
+
+    def iter_detailed_samples(self, step=None, points=None, chunk_rows=None):
+        """
+        Детальная таблица всей конструкции по частям не больше chunk_rows строк;
+        длинный стержень с мелким шагом делится между несколькими частями.
+        Каждая часть - как в detailed_samples
+        """
+        chunk_rows = self.DETAIL_CHUNK_ROWS if chunk_rows is None else chunk_rows
+        counts = self.detailed_counts(step, points)
+        row_ends = np.cumsum(counts)
+        total = int(row_ends[-1]) if len(row_ends) else 0
+        for start in range(0, total, chunk_rows):
+            rows = np.arange(start, min(start + chunk_rows, total), dtype=np.int64)
+            bar = np.searchsorted(row_ends, rows, side='right')
+            index = rows - (row_ends[bar] - counts[bar])
+            yield self._samples_at(bar, index, counts[bar], step, points)
+
+    def write_detailed_csv(self, filename, step=None, points=None, chunk_rows=None):
+        """
+        Потоковая запись детальной таблицы всей конструкции в CSV
+        В памяти одновременно не больше одной части таблицы; числа
+        записываются с той же точностью, что и в детальной таблице окна результатов
+        Возвращает число записанных строк
+        Часть таблицы форматируется одной операцией: строка формата повторяется
+        по числу строк и применяется к значениям np.column_stack построчно
+        """
+        columns = ('x_global', 'element', 'index', 'x_local', 'Nx', 'σx', 'Ux')
+        row_format = '%.4f,%d,%d,%.4f,%.4f,%.4f,%.8f\n'
+        rows = 0
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            f.write('Глобальная координата,Элемент,Индекс,Локальная координата,Nx,σx,Ux\n')
+            for chunk in self.iter_detailed_samples(step, points, chunk_rows):
+                values = np.column_stack([chunk[column] for column in columns])
+                f.write((row_format * len(values)) % tuple(values.ravel().tolist()))
+                rows += len(values)
+        return rows
+
+    def epure_geometry(self, component, tolerance=None):
+        """
+        Точная геометрия эпюры Nx, σx или Ux для LineCollection и PolyCollection
+        Nx и σx линейны по стержню, поэтому на стержень приходится один отрезок;
+        Ux квадратична, и стержень делится на m = ceil(L·sqrt(|u2| / (4·tolerance)))
+        отрезков, чтобы хорда отклонялась от параболы не более чем на tolerance
+        (по умолчанию EPURE_TOLERANCE от наибольшего |Ux|)
+        Возвращает отрезки (S, 2, 2) и четырёхугольники заливки до нуля (S, 4, 2)
+        для LineCollection и fill_path
+        """
+        key = (component, tolerance)
+        if key in self._epures:
+            return self._epures[key]
+
+        L = self.kernels.L
+        n_bars = len(L)
+        if component == 'Ux':
+            u2 = np.abs(self.U[:, 2])
+            if tolerance is None and n_bars:
+                extrema = self.calculate_extrema()
+                tolerance = self.EPURE_TOLERANCE * max(abs(extrema['max_Ux']), abs(extrema['min_Ux']))
+            if tolerance:
+                m = np.ceil(L * np.sqrt(u2 / (4 * tolerance)))
+            else:
+                m = np.where(u2 > 0, self.EPURE_MAX_SEGMENTS, 1)
+            m = np.clip(m, 1, self.EPURE_MAX_SEGMENTS).astype(np.intp)
+        elif component in ('Nx', 'σx'):
+            m = np.ones(n_bars, dtype=np.intp)
+        else:
+            raise ValueError(f"Неизвестная компонента эпюры '{component}'")
+
+        # Номер стержня и номер отрезка внутри стержня для всех отрезков сразу
+        bar = np.repeat(np.arange(n_bars), m)
+        first = np.cumsum(m) - m
+        j = np.arange(len(bar)) - np.repeat(first, m)
+        step = L[bar] / m[bar]
+        x_local = np.stack([j * step, (j + 1) * step], axis=1)
+        x_global = x_local + self.node_positions[bar, None]
+
+        if component == 'Ux':
+            U = self.U[bar]
+            y = U[:, 0, None] + x_local * U[:, 1, None] + x_local**2 * U[:, 2, None]
+        else:
+            N = self.N[bar]
+            y = N[:, 0, None] + x_local * N[:, 1, None]
+            if component == 'σx':
+                y = y / self.kernels.A[bar, None]
+
+        segments = np.stack([x_global, y], axis=2)
+        fills = np.empty((len(bar), 4, 2), dtype=float)
+        fills[:, 0] = (0.0, 0.0)
+        fills[:, 0, 0] = x_global[:, 0]
+        fills[:, 1:3] = segments
+        fills[:, 3, 0] = x_global[:, 1]
+        fills[:, 3, 1] = 0.0
+
+        self._epures[key] = (segments, fills)
+        return segments, fills
+
+    @staticmethod
+    def fill_path(fills):
+        """
+        Заливка эпюры одним составным контуром: полупрозрачные четырёхугольники
+        закрашиваются за один проход и не дают швов на общих сторонах
+        """
+        if len(fills) == 0:
+            return Path(np.empty((0, 2)))
+        return Path.make_compound_path_from_polys(fills)
+
+    def draw_epure(self, ax, component, color, tolerance=None, linewidth=2, alpha=0.3):
+        """
+        Отрисовка эпюры одной LineCollection и одним составным контуром заливки
+        Возвращает пару художников (линия, заливка)
+        """
+        segments, fills = self.epure_geometry(component, tolerance)
+        fill = PathPatch(self.fill_path(fills), facecolor=color, edgecolor='none', alpha=alpha)
+        line = LineCollection(segments, colors=color, linewidths=linewidth)
+        ax.add_patch(fill)
+        ax.add_collection(line)
+        ax.autoscale_view()
+        return line, fill
+
     def display_results_table(self):
         """
         Отображение таблицы результатов
@@ -115,50 +430,26 @@ class PostProcessor:
         """
         fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 12))
         
-        # Подготовка данных для графиков
-        x_global = []
-        Nx_values = []
-        sigma_values = []
-        Ux_values = []
-        
-        current_position = 0
-        for i, kernel in enumerate(self.kernels):
-            x_local = np.linspace(0, kernel['L'], int(100 * kernel['L'] / self.total_length))
-            
-            for x in x_local:
-                global_x = current_position + x
-                x_global.append(global_x)
-                
-                Nx = self.N[i][0] + x * self.N[i][1]
-                Nx_values.append(Nx)
-                sigma_values.append(Nx / kernel['A'])
-                Ux_values.append(self.U[i][0] + x * self.U[i][1] + (x**2) * self.U[i][2])
-            
-            current_position += kernel['L']
-        
         # Эпюра Nx
-        ax1.plot(x_global, Nx_values, 'r-', linewidth=2)
+        self.draw_epure(ax1, 'Nx', 'red')
         ax1.set_title('Эпюра продольных сил Nx')
         ax1.set_xlabel('Длина конструкции, м')
         ax1.set_ylabel('Nx, Н')
         ax1.grid(True)
-        ax1.fill_between(x_global, Nx_values, alpha=0.3, color='red')
         
         # Эпюра σx
-        ax2.plot(x_global, sigma_values, 'b-', linewidth=2)
+        self.draw_epure(ax2, 'σx', 'blue')
         ax2.set_title('Эпюра нормальных напряжений σx')
         ax2.set_xlabel('Длина конструкции, м')
         ax2.set_ylabel('σx, Па')
         ax2.grid(True)
-        ax2.fill_between(x_global, sigma_values, alpha=0.3, color='blue')
         
         # Эпюра Ux
-        ax3.plot(x_global, Ux_values, 'g-', linewidth=2)
+        self.draw_epure(ax3, 'Ux', 'green')
         ax3.set_title('Эпюра перемещений Ux')
         ax3.set_xlabel('Длина конструкции, м')
         ax3.set_ylabel('Ux, м')
         ax3.grid(True)
-        ax3.fill_between(x_global, Ux_values, alpha=0.3, color='green')
         
         plt.tight_layout()
         plt.show()
@@ -169,47 +460,22 @@ class PostProcessor:
         """
         fig, ax = plt.subplots(figsize=(14, 8))
         
-        # Подготовка данных
-        x_global = []
-        Nx_values = []
-        sigma_values = []
-        Ux_values = []
-        
-        current_position = 0
-        for i, kernel in enumerate(self.kernels):
-            x_local = np.linspace(0, kernel['L'], int(100 * kernel['L'] / self.total_length))
-            
-            for x in x_local:
-                global_x = current_position + x
-                x_global.append(global_x)
-                
-                Nx = self.N[i][0] + x * self.N[i][1]
-                Nx_values.append(Nx)
-                sigma_values.append(Nx / kernel['A'])
-                Ux_values.append(self.U[i][0] + x * self.U[i][1] + (x**2) * self.U[i][2])
-            
-            current_position += kernel['L']
-        
-        # Нормализация для совмещения на одном графике
-        if max(Nx_values) != min(Nx_values):
-            Nx_norm = (Nx_values - np.min(Nx_values)) / (np.max(Nx_values) - np.min(Nx_values))
-        else:
-            Nx_norm = [0.5] * len(Nx_values)
-            
-        if max(sigma_values) != min(sigma_values):
-            sigma_norm = (sigma_values - np.min(sigma_values)) / (np.max(sigma_values) - np.min(sigma_values))
-        else:
-            sigma_norm = [0.5] * len(sigma_values)
-            
-        if max(Ux_values) != min(Ux_values):
-            Ux_norm = (Ux_values - np.min(Ux_values)) / (np.max(Ux_values) - np.min(Ux_values))
-        else:
-            Ux_norm = [0.5] * len(Ux_values)
-        
-        # Совмещённый график
-        ax.plot(x_global, Nx_norm, 'r-', linewidth=2, label='Nx (норм.)')
-        ax.plot(x_global, sigma_norm, 'b-', linewidth=2, label='σx (норм.)')
-        ax.plot(x_global, Ux_norm, 'g-', linewidth=2, label='Ux (норм.)')
+        # Нормализация по точным экстремумам для совмещения на одном графике
+        extrema = self.calculate_extrema()
+        for component, key, color, label in (
+            ('Nx', 'Nx', 'red', 'Nx (норм.)'),
+            ('σx', 'sigma', 'blue', 'σx (норм.)'),
+            ('Ux', 'Ux', 'green', 'Ux (норм.)'),
+        ):
+            segments, _ = self.epure_geometry(component)
+            segments = segments.copy()
+            low, high = extrema[f'min_{key}'], extrema[f'max_{key}']
+            if high != low:
+                segments[..., 1] = (segments[..., 1] - low) / (high - low)
+            else:
+                segments[..., 1] = 0.5
+            ax.add_collection(LineCollection(segments, colors=color, linewidths=2, label=label))
+        ax.autoscale_view()
         
         ax.set_title('Совмещённые эпюры компонент НДС на конструкции')
         ax.set_xlabel('Длина конструкции, м')
@@ -217,14 +483,16 @@ class PostProcessor:
         ax.legend()
         ax.grid(True)
         
-        # Разметка стержней
-        current_pos = 0
-        for i, kernel in enumerate(self.kernels):
-            ax.axvline(x=current_pos, color='k', linestyle='--', alpha=0.5)
-            ax.text(current_pos + kernel['L']/2, -0.1, f'Стержень {i+1}', 
-                   ha='center', transform=ax.get_xaxis_transform())
-            current_pos += kernel['L']
-        ax.axvline(x=current_pos, color='k', linestyle='--', alpha=0.5)
+        # Разметка стержней: границы одним набором линий через всю высоту оси
+        nodes = self.node_positions
+        ax.vlines(nodes, 0, 1, colors='k', linestyles='--', alpha=0.5,
+                  transform=ax.get_xaxis_transform())
+        # Подписи стержней только пока они помещаются
+        if len(self.kernels) <= self.MAX_BAR_LABELS:
+            centers = (nodes[:-1] + nodes[1:]) / 2
+            for i, x in enumerate(centers.tolist()):
+                ax.text(x, -0.1, f'Стержень {i+1}', 
+                       ha='center', transform=ax.get_xaxis_transform())
         
         plt.tight_layout()
         plt.show()
@@ -237,12 +505,13 @@ class PostProcessor:
         df = self.create_results_table()
         
         # Расчёт экстремальных значений
-        max_Nx = df['Nx'].max()
-        min_Nx = df['Nx'].min()
-        max_sigma = df['σx'].max()
-        min_sigma = df['σx'].min()
-        max_Ux = df['Ux'].max()
-        min_Ux = df['Ux'].min()
+        extrema = self.calculate_extrema()
+        max_Nx = extrema['max_Nx']
+        min_Nx = extrema['min_Nx']
+        max_sigma = extrema['max_sigma']
+        min_sigma = extrema['min_sigma']
+        max_Ux = extrema['max_Ux']
+        min_Ux = extrema['min_Ux']
         
         # Сохранение в файл
         filename, _ = QFileDialog.getSaveFileName(main_window, 'Сохранить отчёт', filter='*.csv')
@@ -271,24 +540,86 @@ class PostProcessor:
             return filename
         return None
 
+    def calculate_extrema(self):
+        """
+        Точные экстремумы Nx, σx и Ux по каждому стержню и по конструкции за O(n)
+        Nx и σx линейны в пределах стержня, поэтому экстремумы на концах;
+        Ux квадратична, поэтому дополнительно проверяется вершина параболы
+        """
+        if self._extrema is not None:
+            return self._extrema
+
+        L = self.kernels.L
+        A = self.kernels.A
+        x_start = self.node_positions[:-1]
+
+        Nx_start = self.N[:, 0]
+        Nx_end = self.N[:, 0] + L * self.N[:, 1]
+        sigma_start = Nx_start / A
+        sigma_end = Nx_end / A
+
+        # Вершина параболы u(x), прижатая к границам стержня
+        u0, u1, u2 = self.U[:, 0], self.U[:, 1], self.U[:, 2]
+        has_vertex = u2 != 0
+        x_vertex = np.where(has_vertex, np.clip(-u1 / (2 * np.where(has_vertex, u2, 1.0)), 0, L), 0.0)
+        Ux_candidates = np.stack([
+            u0,
+            u0 + u1 * L + u2 * L**2,
+            u0 + u1 * x_vertex + u2 * x_vertex**2
+        ])
+
+        # Для пустой модели экстремумы по конструкции не определены (NaN)
+        def extreme(values, reduce):
+            return float(reduce(values)) if values.size else float('nan')
+
+        abs_sigma_max = np.maximum(np.abs(sigma_start), np.abs(sigma_end))
+        max_abs_sigma = extreme(abs_sigma_max, np.max)
+
+        # Опасные сечения - концы стержней, где |σx| достигает максимума
+        section_x = np.concatenate([x_start, x_start + L])
+        section_sigma = np.concatenate([sigma_start, sigma_end])
+        order = np.argsort(section_x, kind='stable')
+        section_x, section_sigma = section_x[order], section_sigma[order]
+        dangerous = np.isclose(np.abs(section_sigma), max_abs_sigma, rtol=1e-12, atol=0)
+        dangerous_sections = np.column_stack([section_x[dangerous], section_sigma[dangerous]]).tolist()
+
+        extrema = {
+            'Nx_min': np.minimum(Nx_start, Nx_end),
+            'Nx_max': np.maximum(Nx_start, Nx_end),
+            'sigma_min': np.minimum(sigma_start, sigma_end),
+            'sigma_max': np.maximum(sigma_start, sigma_end),
+            'Ux_min': Ux_candidates.min(axis=0),
+            'Ux_max': Ux_candidates.max(axis=0),
+            'abs_sigma_max': abs_sigma_max,
+        }
+        extrema.update({
+            'max_Nx': extreme(extrema['Nx_max'], np.max),
+            'min_Nx': extreme(extrema['Nx_min'], np.min),
+            'max_sigma': extreme(extrema['sigma_max'], np.max),
+            'min_sigma': extreme(extrema['sigma_min'], np.min),
+            'max_Ux': extreme(extrema['Ux_max'], np.max),
+            'min_Ux': extreme(extrema['Ux_min'], np.min),
+            'max_abs_sigma': max_abs_sigma,
+            'dangerous_sections': dangerous_sections,
+        })
+        self._extrema = extrema
+        return extrema
+
     def analyze_results(self):
         """
         Анализ результатов расчёта
         """
-        df = self.create_results_table()
-        
-        max_sigma_abs = df['σx'].abs().max()
-        dangerous_sections = df[df['σx'].abs() == max_sigma_abs][['Глобальная координата', 'σx']].values.tolist()
+        extrema = self.calculate_extrema()
         
         analysis = {
-            'max_Nx': df['Nx'].max(),
-            'min_Nx': df['Nx'].min(),
-            'max_sigma': df['σx'].max(),
-            'min_sigma': df['σx'].min(),
-            'max_Ux': df['Ux'].max(),
-            'min_Ux': df['Ux'].min(),
-            'dangerous_sections': dangerous_sections,
-            'max_abs_sigma': max_sigma_abs
+            'max_Nx': extrema['max_Nx'],
+            'min_Nx': extrema['min_Nx'],
+            'max_sigma': extrema['max_sigma'],
+            'min_sigma': extrema['min_sigma'],
+            'max_Ux': extrema['max_Ux'],
+            'min_Ux': extrema['min_Ux'],
+            'dangerous_sections': extrema['dangerous_sections'],
+            'max_abs_sigma': extrema['max_abs_sigma']
         }
         
         print("АНАЛИЗ РЕЗУЛЬТАТОВ:")
@@ -307,13 +638,11 @@ class PostProcessor:
         """
         Проверка прочности по допускаемым напряжениям
         """
-        df = self.create_results_table()
-        max_stress = df['σx'].abs().max()
+        abs_sigma_max = self.calculate_extrema()['abs_sigma_max']
+        bars = BarSet.coerce(bars)
         
         results = []
-        for i, bar in enumerate(bars):
-            allowable_stress = bar['sigma']
-            actual_max_stress = df[df['Элемент'] == i+1]['σx'].abs().max()
+        for i, (allowable_stress, actual_max_stress) in enumerate(zip(bars.sigma.tolist(), abs_sigma_max.tolist())):
             safety_factor = allowable_stress / actual_max_stress if actual_max_stress > 0 else float('inf')
             is_safe = actual_max_stress <= allowable_stress
             
@@ -331,4 +660,4 @@ class PostProcessor:
             print(f"  Запас прочности: {safety_factor:.2f}")
             print(f"  Состояние: {'БЕЗОПАСНО' if is_safe else 'ОПАСНО!'}")
         
-        return results
\ No newline at end of file
+        return results
@@ -1,39 +1,433 @@
 # processor.py
+import hashlib
+from collections import OrderedDict
 import numpy as np
+from barset import BarSet
+
+
+def assemble_stiffness_diagonals(L, A, E):
+    """
+    Векторная сборка матрицы жёсткости по массивам параметров стержней
+    Возвращает главную диагональ и наддиагональ.
+    Вычисления идут по последней оси, поэтому массивы формы
+    (..., n_bars) дают сразу пакет матриц
+    """
+    k = np.asarray(A, dtype=float) * np.asarray(E, dtype=float) / np.asarray(L, dtype=float)
+    diag = np.zeros(k.shape[:-1] + (k.shape[-1] + 1,), dtype=float)
+    diag[..., :-1] += k
+    diag[..., 1:] += k
+    return diag, -k
+
+
+def node_forces_to_array(node_forces, n_nodes):
+    """
+    Перевод списка сосредоточенных сил в вектор узловых нагрузок
+    """
+    F = np.zeros(n_nodes, dtype=float)
+    if node_forces:
+        nodes = np.array([f['node'] for f in node_forces], dtype=int) - 1
+        values = np.array([f['F'] for f in node_forces], dtype=float)
+        np.add.at(F, nodes, values)
+    return F
+
+
+def assemble_load_vector(L, q, node_loads):
+    """
+    Векторная сборка вектора нагрузок:
+    узловые силы node_loads плюс по q*L/2 в оба узла каждого стержня
+    """
+    L = np.asarray(L, dtype=float)
+    q = np.asarray(q, dtype=float)
+    F = np.array(node_loads, dtype=float)
+    Fe = np.where(np.abs(q) > 0.0001, q * L / 2, 0.0)
+    F[..., :-1] += Fe
+    F[..., 1:] += Fe
+    return F
+
+
+def factorize_tridiagonal(diag, off):
+    """
+    LDLᵀ-разложение симметричной трёхдиагональной матрицы за O(n)
+    diag - главная диагональ, off - наддиагональ (на один элемент короче)
+    Возвращает диагональ D и поддиагональ единичной матрицы L
+    """
+    diag = np.asarray(diag, dtype=float).tolist()
+    off = np.asarray(off, dtype=float).tolist()
+    n = len(diag)
+    d = [0.0] * n
+    l = [0.0] * max(n - 1, 0)
+    if n == 0:
+        return np.array(d), np.array(l)
+
+    # Порог вырожденности относительно масштаба жёсткостей
+    tol = 1e-12 * max(abs(v) for v in diag)
+    d[0] = diag[0]
+    for i in range(1, n + 1):
+        if abs(d[i-1]) <= tol:
+            raise np.linalg.LinAlgError("Singular matrix")
+        if i == n:
+            break
+        l[i-1] = off[i-1] / d[i-1]
+        d[i] = diag[i] - l[i-1] * off[i-1]
+
+    return np.array(d), np.array(l)
+
+
+def solve_factorized(d, l, F):
+    """
+    Решение системы по готовому LDLᵀ-разложению
+    F - вектор нагрузок (n) или матрица (n, k) с нагрузками по столбцам
+    """
+    F = np.asarray(F, dtype=float)
+    n = len(d)
+    if n == 0:
+        return F.copy()
+
+    # Узкие матрицы нагрузок быстрее решать по столбцам
+    if F.ndim == 2 and 0 < F.shape[1] <= 8:
+        return np.column_stack([solve_factorized(d, l, column) for column in F.T]).reshape(F.shape)
+
+    d = d.tolist()
+    l = l.tolist()
+    # Для вектора работаем со скалярами, для матрицы - со строками
+    z = F.tolist() if F.ndim == 1 else list(F)
+
+    # Прямой ход: L·z = F
+    for i in range(1, n):
+        z[i] = z[i] - l[i-1] * z[i-1]
+    # Масштабирование: D·y = z
+    for i in range(n):
+        z[i] = z[i] / d[i]
+    # Обратный ход: Lᵀ·x = y
+    for i in range(n - 2, -1, -1):
+        z[i] = z[i] - l[i] * z[i+1]
+
+    return np.array(z, dtype=float)
+
+
+def free_dof_range(n_nodes, fixed):
+    """
+    Границы непрерывного участка свободных узлов [first, last)
+    Закрепляться могут только крайние узлы
+    """
+    first = 1 if 0 in fixed else 0
+    last = n_nodes - 1 if n_nodes - 1 in fixed else n_nodes
+    return first, last
+
+
+def solve_tridiagonal_batch(diag, off, F):
+    """
+    Решение пакета симметричных трёхдиагональных систем
+    diag - (n_systems, n), off - (n_systems, n - 1), F - (n_systems, n)
+    Цикл идёт по узлам, все системы обрабатываются векторно
+    """
+    # Раскладка (n, n_systems): строка на узел, системы подряд в памяти
+    diag = np.array(np.asarray(diag, dtype=float).T, order='C')
+    off = np.ascontiguousarray(np.asarray(off, dtype=float).T)
+    z = np.array(np.asarray(F, dtype=float).T, order='C')
+    n = diag.shape[0]
+    if n == 0:
+        return z.T.copy()
+
+    tol = 1e-12 * np.abs(diag).max(axis=0)
+    l = np.empty_like(off)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Прямой ход: diag превращается в диагональ D разложения LDLᵀ
+        for i in range(1, n):
+            l[i-1] = off[i-1] / diag[i-1]
+            diag[i] -= l[i-1] * off[i-1]
+            z[i] -= l[i-1] * z[i-1]
+        if not np.all(np.abs(diag) > tol):
+            raise np.linalg.LinAlgError("Singular matrix")
+        # Обратный ход
+        z /= diag
+        for i in range(n - 2, -1, -1):
+            z[i] -= l[i] * z[i+1]
+
+    return z.T.copy()
+
+
+def solve_supported_batch(diag, off, F, fixed, support_values):
+    """
+    Пакетное решение с учётом опор: системы строятся только для свободных узлов
+    """
+    F = np.asarray(F, dtype=float)
+    n_nodes = F.shape[-1]
+    first, last = free_dof_range(n_nodes, fixed)
+    U = np.zeros(F.shape, dtype=float)
+    U[:, first:last] = solve_tridiagonal_batch(
+        diag[:, first:last], off[:, first:last-1], F[:, first:last]
+    )
+    if fixed:
+        U[:, fixed] = support_values
+    return U
+
+
+def _bar_arrays_like(U, *columns):
+    """
+    Приведение столбцов стержней к форме (n_bars, 1, ...) для пакета решений U
+    """
+    extra = (1,) * (U.ndim - 1)
+    result = []
+    for column in columns:
+        column = np.asarray(column, dtype=float)
+        if column.ndim < U.ndim:
+            column = column.reshape((-1,) + extra)
+        result.append(column)
+    return result
+
+
+def internal_forces_coefficients(U, L, A, E, q):
+    """
+    Коэффициенты N(x) = N0 + N1*x по узловым перемещениям
+    U - (n_nodes) или (n_nodes, n_cases); q - (n_bars) или (n_bars, n_cases)
+    Возвращает массив (n_bars, 2) или (n_bars, 2, n_cases)
+    """
+    U = np.asarray(U, dtype=float)
+    L, A, E, q = _bar_arrays_like(U, L, A, E, q)
+    delta_U = U[1:] - U[:-1]
+    N0 = (A * E / L) * delta_U + q * L / 2
+    N1 = np.broadcast_to(-q, N0.shape)
+    return np.stack([N0, N1], axis=1)
+
+
+def displacement_coefficients(U, L, A, E, q):
+    """
+    Коэффициенты u(x) = u0 + u1*x + u2*x² по узловым перемещениям
+    Возвращает массив (n_bars, 3) или (n_bars, 3, n_cases)
+    """
+    U = np.asarray(U, dtype=float)
+    L, A, E, q = _bar_arrays_like(U, L, A, E, q)
+    u0 = U[:-1]
+    u1 = (U[1:] - U[:-1]) / L + (q * L) / (2 * E * A)
+    u2 = np.broadcast_to(-q / (2 * E * A), u0.shape)
+    return np.stack([u0, u1, u2], axis=1)
+
+
+def max_abs_displacement(U_coeffs, L):
+    """
+    Наибольшее |u(x)| по конструкции с учётом вершины параболы внутри стержня
+    U_coeffs - (n_bars, 3) или (n_bars, 3, n_cases)
+    """
+    U_coeffs = np.asarray(U_coeffs, dtype=float)
+    u0, u1, u2 = U_coeffs[:, 0], U_coeffs[:, 1], U_coeffs[:, 2]
+    (L,) = _bar_arrays_like(u0, L)
+
+    u_end = u0 + u1 * L + u2 * L**2
+    # Вершина параболы, прижатая к границам стержня
+    has_vertex = u2 != 0
+    x_vertex = np.where(has_vertex, np.clip(-u1 / (2 * np.where(has_vertex, u2, 1.0)), 0, L), 0.0)
+    u_vertex = u0 + u1 * x_vertex + u2 * x_vertex**2
+
+    return np.max(np.maximum(np.maximum(np.abs(u0), np.abs(u_end)), np.abs(u_vertex)), axis=0)
+
+
+def evaluate_batch(L, A, E, q, node_loads, fixed, support_values):
+    """
+    Сборка и решение пачки конструкций одним пакетом
+    L, A, E, q - (n_cases, n_bars); node_loads - (n_cases, n_nodes)
+    Возвращает узловые перемещения (n_cases, n_nodes), наибольшие |σx|
+    по стержням (n_cases, n_bars) и наибольшее |Ux| по конструкции (n_cases)
+    """
+    diag, off = assemble_stiffness_diagonals(L, A, E)
+    F = assemble_load_vector(L, q, node_loads)
+    U = solve_supported_batch(diag, off, F, fixed, support_values)
+
+    # Коэффициенты в раскладке (n_bars, k, n_cases)
+    N_coeffs = internal_forces_coefficients(U.T, L.T, A.T, E.T, q.T)
+    U_coeffs = displacement_coefficients(U.T, L.T, A.T, E.T, q.T)
+
+    # σx линейна по стержню, поэтому экстремум на его концах
+    sigma_start = N_coeffs[:, 0] / A.T
+    sigma_end = (N_coeffs[:, 0] + N_coeffs[:, 1] * L.T) / A.T
+    max_sigma = np.maximum(np.abs(sigma_start), np.abs(sigma_end)).T
+    max_Ux = max_abs_displacement(U_coeffs, L.T)
+    return U, max_sigma, max_Ux
+
+
+class StiffnessFactorization:
+    """
+    Разложение матрицы жёсткости с учётом опор
+    Выполняется один раз, после чего решает любое число векторов нагрузок
+    """
+    def __init__(self, diag, off, fixed, support_values):
+        self.n_nodes = len(diag)
+        self.fixed = list(fixed)
+        self.support_values = np.asarray(support_values, dtype=float)
+
+        # Закрепляются только крайние узлы, поэтому свободные узлы идут подряд
+        self.first, self.last = free_dof_range(self.n_nodes, self.fixed)
+
+        self.d, self.l = factorize_tridiagonal(
+            diag[self.first:self.last], off[self.first:self.last-1]
+        )
+
+    def solve(self, F):
+        """
+        F - вектор нагрузок (n_nodes) или матрица (n_nodes, n_cases)
+        """
+        F = np.asarray(F, dtype=float)
+        U = np.zeros(F.shape, dtype=float)
+        U[self.first:self.last] = solve_factorized(self.d, self.l, F[self.first:self.last])
+        if self.fixed:
+            U[self.fixed] = self.support_values.reshape((-1,) + (1,) * (F.ndim - 1))
+        return U
+
+    def solve_updated(self, F, bar_indices, delta_k):
+        """
+        Решение для матрицы K + ΔK, где ΔK - изменение жёсткостей стержней
+        bar_indices на delta_k, по формуле Шермана–Моррисона–Вудбери:
+        (K + V·C·Vᵀ)⁻¹ = K⁻¹ - K⁻¹·V·(I + C·Vᵀ·K⁻¹·V)⁻¹·C·Vᵀ·K⁻¹
+        Исходное разложение при этом не меняется
+        """
+        F = np.asarray(F, dtype=float)
+        bar_indices = np.asarray(bar_indices, dtype=int)
+        delta_k = np.asarray(delta_k, dtype=float)
+        m = len(bar_indices)
+        n_free = self.last - self.first
+
+        # Столбцы V: +1 в начальном и -1 в конечном узле стержня (только свободные узлы)
+        V = np.zeros((n_free, m), dtype=float)
+        columns = np.arange(m)
+        start = bar_indices - self.first
+        end = start + 1
+        inside = (start >= 0) & (start < n_free)
+        V[start[inside], columns[inside]] = 1.0
+        inside = (end >= 0) & (end < n_free)
+        V[end[inside], columns[inside]] = -1.0
+
+        # Одно решение для нагрузки и всех столбцов V сразу
+        rhs = np.column_stack([F[self.first:self.last], V])
+        solution = solve_factorized(self.d, self.l, rhs)
+        x0, Z = solution[:, 0], solution[:, 1:]
+
+        capacitance = np.eye(m) + delta_k[:, None] * (V.T @ Z)
+        if np.linalg.cond(capacitance) > 1e12:
+            raise np.linalg.LinAlgError("Singular matrix")
+        correction = np.linalg.solve(capacitance, delta_k * (V.T @ x0))
+
+        U = np.zeros(self.n_nodes, dtype=float)
+        U[self.first:self.last] = x0 - Z @ correction
+        if self.fixed:
+            U[self.fixed] = self.support_values
+        return U
+
+
+class FactorizationCache:
+    """
+    LRU-кэш разложений матрицы жёсткости
+    Ключ - хэш массивов L, A, E и конфигурации опор, поэтому
+    изменение только нагрузок не требует повторной сборки и разложения
+    """
+    def __init__(self, maxsize=16):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    @staticmethod
+    def make_key(L, A, E, fixed, support_values):
+        digest = hashlib.sha1()
+        digest.update(repr((len(L), tuple(fixed), tuple(support_values))).encode())
+        for column in (L, A, E):
+            digest.update(np.ascontiguousarray(column, dtype=float).tobytes())
+        return digest.hexdigest()
+
+    def get(self, key):
+        factorization = self._items.get(key)
+        if factorization is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return factorization
+
+    def put(self, key, factorization):
+        self._items[key] = factorization
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+# Общий кэш разложений для всех экземпляров процессора
+factorization_cache = FactorizationCache()
+
 
 class RodStructureProcessor:
-    def __init__(self, bars, node_forces, supports):
-        self.bars = bars
+    # Начиная с этого числа узлов матрица жёсткости хранится только диагоналями
+    BANDED_THRESHOLD = 50
+    # Наибольшее число изменённых стержней для пересчёта поправкой Вудбери
+    INCREMENTAL_MAX_RANK = 8
+
+    def __init__(self, bars, node_forces, supports, solve_mode="auto", cache=factorization_cache):
+        """
+        solve_mode - способ решения системы:
+        "dense" - полная матрица и np.linalg.solve,
+        "banded" - трёхдиагональная матрица и LDLᵀ-разложение за O(n),
+        "direct" - прямое интегрирование (только при одной заделке),
+        "auto" - прямое интегрирование для статически определимой схемы,
+        иначе ленточный решатель для систем больше BANDED_THRESHOLD узлов
+        cache - кэш разложений для ленточного решателя (None - без кэша)
+        """
+        # Собственная копия: update_bars меняет стержни процессора, а не модель вызывающего
+        self.bars = BarSet.coerce(bars).copy()
         self.node_forces = node_forces
         self.supports = supports
         self.n_nodes = len(bars) + 1
+        self.solve_mode = solve_mode
+        self.cache = cache
+
+        # Состояние для инкрементального пересчёта (update_bars)
+        self._base_factorization = None
+        self._base_k = None
+        self.last_U = None
+
+    def use_banded_solver(self):
+        if self.solve_mode == "banded":
+            return True
+        if self.solve_mode == "dense":
+            return False
+        return self.n_nodes > self.BANDED_THRESHOLD
+
+    def bar_columns(self):
+        """
+        Параметры стержней в виде массивов L, A, E, q
+        """
+        return self.bars.L, self.bars.A, self.bars.E, self.bars.q
 
     def assemble_global_K(self):
-        K = np.zeros((self.n_nodes, self.n_nodes), dtype=float)
-        for i, bar in enumerate(self.bars):
-            L, A, E = bar['L'], bar['A'], bar['E']
-            k = A * E / L
-            k_local = np.array([[k, -k], [-k, k]])
-            n1, n2 = i, i + 1
-            K[n1:n2+1, n1:n2+1] += k_local
+        diag, off = self.assemble_global_K_banded()
+        K = np.diag(diag)
+        idx = np.arange(self.n_nodes - 1)
+        K[idx, idx + 1] = off
+        K[idx + 1, idx] = off
         return K
 
+    def assemble_global_K_banded(self):
+        """
+        Сборка матрицы жёсткости в ленточном виде:
+        главная диагональ (n_nodes) и наддиагональ (n_nodes - 1)
+        """
+        L, A, E, _ = self.bar_columns()
+        return assemble_stiffness_diagonals(L, A, E)
+
     def assemble_global_F(self):
-        F = np.zeros(self.n_nodes, dtype=float)
-        for f in self.node_forces:
-            node_idx = f['node'] - 1
-            F[node_idx] += f['F']
-        for i, bar in enumerate(self.bars):
-            q = bar.get('q', 0)
-            L = bar['L']
-            if abs(q) > 0.0001:
-                Fe1 = q * L / 2
-                Fe2 = q * L / 2
-                F[i] += Fe1
-                F[i+1] += Fe2
-        return F
+        L, _, _, q = self.bar_columns()
+        node_loads = node_forces_to_array(self.node_forces, self.n_nodes)
+        return assemble_load_vector(L, q, node_loads)
 
-    def apply_supports(self, K, F):
+    def get_fixed_dofs(self):
+        """
+        Закреплённые узлы и их заданные перемещения
+        """
         fixed = []
         support_values = []
         
@@ -48,6 +442,11 @@ class RodStructureProcessor:
             elif s == "Обе":
                 fixed.extend([0, self.n_nodes - 1])
                 support_values.extend([0.0, 0.0])
+
+        return fixed, support_values
+
+    def apply_supports(self, K, F):
+        fixed, support_values = self.get_fixed_dofs()
         
         if fixed:
             free_dofs = [i for i in range(self.n_nodes) if i not in fixed]
@@ -66,12 +465,160 @@ class RodStructureProcessor:
         else:
             return np.linalg.solve(K, F)
 
+    def apply_supports_banded(self, diag, off, F):
+        """
+        Учёт опор и решение трёхдиагональной системы за O(n)
+        """
+        fixed, support_values = self.get_fixed_dofs()
+        return StiffnessFactorization(diag, off, fixed, support_values).solve(F)
+
+    def factorize(self):
+        """
+        Разложение матрицы жёсткости с учётом опор для многократного решения
+        При попадании в кэш сборка и разложение не выполняются
+        """
+        fixed, support_values = self.get_fixed_dofs()
+        if self.cache is None:
+            diag, off = self.assemble_global_K_banded()
+            return StiffnessFactorization(diag, off, fixed, support_values)
+
+        L, A, E, _ = self.bar_columns()
+        key = self.cache.make_key(L, A, E, fixed, support_values)
+        factorization = self.cache.get(key)
+        if factorization is None:
+            diag, off = assemble_stiffness_diagonals(L, A, E)
+            factorization = StiffnessFactorization(diag, off, fixed, support_values)
+            self.cache.put(key, factorization)
+        return factorization
+
+    def is_statically_determinate(self):
+        fixed, _ = self.get_fixed_dofs()
+        return len(fixed) == 1
+
+    def solve_statically_determinate(self, F=None):
+        """
+        Прямое интегрирование для схемы с одной заделкой без сборки K:
+        усилие в стержне равно сумме узловых нагрузок со стороны свободного конца,
+        перемещения узлов - накопленная сумма удлинений стержней
+        """
+        fixed, support_values = self.get_fixed_dofs()
+        if len(fixed) != 1:
+            raise ValueError("Прямое интегрирование применимо только при одной заделке")
+        if F is None:
+            F = self.assemble_global_F()
+
+        L, A, E, _ = self.bar_columns()
+        compliance = L / (A * E)
+        U = np.empty(self.n_nodes, dtype=float)
+
+        if fixed[0] == 0:
+            # Заделка слева: стержень i растягивают нагрузки узлов i+1..n
+            tension = np.cumsum(F[::-1])[::-1][1:]
+            U[0] = 0.0
+            np.cumsum(tension * compliance, out=U[1:])
+        else:
+            # Заделка справа: стержень i сжимают нагрузки узлов 0..i
+            tension = -np.cumsum(F)[:-1]
+            U[-1] = 0.0
+            U[:-1] = -np.cumsum((tension * compliance)[::-1])[::-1]
+
+        U += support_values[0]
+        return U
+
     def solve(self):
-        K = self.assemble_global_K()
         F = self.assemble_global_F()
-        U = self.apply_supports(K, F)
+        if self.solve_mode == "direct" or (self.solve_mode == "auto" and self.is_statically_determinate()):
+            U = self.solve_statically_determinate(F)
+        elif self.use_banded_solver():
+            U = self._remember_base(self.factorize()).solve(F)
+        else:
+            K = self.assemble_global_K()
+            U = self.apply_supports(K, F)
+        self.last_U = U
+        return U
+
+    def _remember_base(self, factorization):
+        """
+        Запоминание разложения и жёсткостей, относительно которых
+        update_bars строит поправку
+        """
+        L, A, E, _ = self.bar_columns()
+        self._base_factorization = factorization
+        self._base_k = A * E / L
+        return factorization
+
+    def update_bar(self, index, **values):
+        """
+        Изменение L, A и/или E одного стержня с пересчётом перемещений
+        """
+        return self.update_bars({index: values})
+
+    def update_bars(self, changes):
+        """
+        Изменение параметров стержней с пересчётом перемещений
+        changes - словарь {индекс стержня: {'L': ..., 'A': ..., 'E': ...}}
+        Изменения вносятся в self.bars - копию стержней, переданных
+        в конструктор; исходный набор не меняется. Сохранённое разложение не пересобирается:
+        перемещения находятся поправкой низкого ранга. Если изменённых
+        стержней больше INCREMENTAL_MAX_RANK, выполняется полный пересчёт
+        """
+        for index, values in changes.items():
+            for field, value in values.items():
+                self.bars.set_value(index, field, value)
+
+        F = self.assemble_global_F()
+        if self._base_factorization is None:
+            U = self._remember_base(self.factorize()).solve(F)
+            self.last_U = U
+            return U
+
+        L, A, E, _ = self.bar_columns()
+        k = A * E / L
+        changed = np.nonzero(k != self._base_k)[0]
+
+        U = None
+        if len(changed) <= self.INCREMENTAL_MAX_RANK:
+            try:
+                U = self._base_factorization.solve_updated(
+                    F, changed, k[changed] - self._base_k[changed]
+                )
+            except np.linalg.LinAlgError:
+                U = None
+        if U is None:
+            U = self._remember_base(self.factorize()).solve(F)
+
+        self.last_U = U
         return U
 
+    def solve_load_cases(self, node_loads, q=None):
+        """
+        Решение для набора случаев нагружения при неизменной геометрии
+        node_loads - сосредоточенные силы (n_nodes, n_cases), по столбцу на случай
+        q - погонные нагрузки (n_bars, n_cases); по умолчанию берутся из стержней
+        Матрица жёсткости собирается и раскладывается один раз.
+        Возвращает перемещения (n_nodes, n_cases) и коэффициенты
+        N (n_bars, 2, n_cases) и U (n_bars, 3, n_cases)
+        """
+        L, A, E, bar_q = self.bar_columns()
+        node_loads = np.asarray(node_loads, dtype=float)
+        if node_loads.ndim == 1:
+            node_loads = node_loads[:, None]
+        n_cases = node_loads.shape[1]
+
+        if q is None:
+            q = bar_q[:, None]
+        q = np.asarray(q, dtype=float)
+        if q.ndim == 1:
+            q = q[:, None]
+        q = np.broadcast_to(q, (len(L), n_cases))
+
+        F = assemble_load_vector(L, q.T, node_loads.T).T
+        U = self.factorize().solve(F)
+
+        N_coeffs = internal_forces_coefficients(U, L, A, E, q)
+        U_coeffs = displacement_coefficients(U, L, A, E, q)
+        return U, N_coeffs, U_coeffs
+
     def calculate_internal_forces_coefficients(self, U):
         """
         Правильный расчет коэффициентов для продольных сил
@@ -135,6 +682,22 @@ class RodStructureProcessor:
         
         return U_coeffs
 
+    def calculate_internal_forces_coefficients_array(self, U):
+        """
+        Векторный расчёт коэффициентов продольных сил
+        Возвращает массив (n_bars, 2): [N0, N1]
+        """
+        L, A, E, q = self.bar_columns()
+        return internal_forces_coefficients(U, L, A, E, q)
+
+    def calculate_displacement_coefficients_array(self, U):
+        """
+        Векторный расчёт коэффициентов перемещений
+        Возвращает массив (n_bars, 3): [u0, u1, u2]
+        """
+        L, A, E, q = self.bar_columns()
+        return displacement_coefficients(U, L, A, E, q)
+
     def calculate_element_results(self, U):
         """
         Дополнительный метод для расчета результатов по элементам
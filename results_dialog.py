@@ -2,24 +2,42 @@ import sys
 import numpy as np
 import pandas as pd
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QTableWidget, 
-    QTableWidgetItem, QLabel, QLineEdit, QPushButton, QHeaderView,
-    QMessageBox, QGroupBox, QFormLayout, QWidget, QComboBox
+    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QTableView,
+    QLabel, QLineEdit, QPushButton, QHeaderView,
+    QMessageBox, QGroupBox, QFormLayout, QWidget, QComboBox, QFileDialog,
+    QApplication
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.patches import PathPatch
 import matplotlib.pyplot as plt
+from barset import BarSet
+from postprocessor import PostProcessor
+from table_models import ArrayTableModel
 
 class ResultsDialog(QDialog):
-    def __init__(self, bars, U, N_coeffs, U_coeffs, parent=None, supports=None, node_forces=None):
+    # Наибольшее число подписей значений на одной эпюре
+    MAX_VALUE_LABELS = 40
+    # Наибольшее число строк детальной таблицы одного стержня в окне
+    MAX_DETAIL_ROWS = 1000000
+    # Наибольшее число строк детальных таблиц всех стержней в отчёте PDF
+    MAX_REPORT_ROWS = 20000
+
+    def __init__(self, bars, U, N_coeffs, U_coeffs, parent=None, supports=None, node_forces=None, post=None):
         super().__init__(parent)
-        self.bars = bars
-        self.U = U
-        self.N_coeffs = N_coeffs
-        self.U_coeffs = U_coeffs
-        self.total_length = sum(bar['L'] for bar in bars)
+        self.bars = BarSet.coerce(bars)
+        self.U = np.asarray(U, dtype=float)
+        self.N_coeffs = np.asarray(N_coeffs, dtype=float).reshape(-1, 2)
+        self.U_coeffs = np.asarray(U_coeffs, dtype=float).reshape(-1, 3)
+        self.total_length = self.bars.total_length
+        # Постпроцессор кэширует геометрию эпюр и экстремумы;
+        # может быть передан уже подготовленным фоновым расчётом
+        if post is None:
+            post = PostProcessor(self.bars, self.N_coeffs, self.U_coeffs)
+        self.post = post
         
         # Сохраняем данные о нагрузках и опорах
         self.supports = supports if supports is not None else []
@@ -30,10 +48,19 @@ class ResultsDialog(QDialog):
         self.resize(1200, 800)
         
         self.init_ui()
-        self.calculate_all_results()
+        
+        # Содержимое вкладок строится при первом открытии вкладки
+        self._tab_loaders = {
+            self.tab_plots: self.calculate_plots,
+            self.tab_tables: self.load_tab_tables,
+            self.tab_section: self.load_tab_section,
+        }
+        self._loaded_tabs = set()
+        self.tabs.currentChanged.connect(self.ensure_tab_loaded)
         
         # АВТОМАТИЧЕСКИ ПЕРЕХОДИМ НА ВКЛАДКУ С ПЕРЕМЕЩЕНИЯМИ УЗЛОВ
         self.tabs.setCurrentIndex(0)
+        self.calculate_all_results()
         
     def init_ui(self):
         layout = QVBoxLayout()
@@ -90,15 +117,14 @@ class ResultsDialog(QDialog):
         layout = QVBoxLayout()
         
         # Информация о системе
-        info_label = QLabel(f"Конструкция состоит из {len(self.bars)} стержней и {len(self.U)} узлов")
-        info_label.setStyleSheet("font-weight: bold; padding: 5px;")
-        layout.addWidget(info_label)
+        self.info_label = QLabel()
+        self.info_label.setStyleSheet("font-weight: bold; padding: 5px;")
+        layout.addWidget(self.info_label)
         
         # Таблица перемещений узлов
-        self.delta_table = QTableWidget()
-        self.delta_table.setRowCount(len(self.U))
-        self.delta_table.setColumnCount(3)
-        self.delta_table.setHorizontalHeaderLabels(["Узел", "Перемещение Δ, м", "Перемещение Δ, мм"])
+        self.delta_model = ArrayTableModel(["Узел", "Перемещение Δ, м", "Перемещение Δ, мм"], self)
+        self.delta_table = QTableView()
+        self.delta_table.setModel(self.delta_model)
         self.delta_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
         # СИНИЙ ЦВЕТ ДЛЯ ЗАГОЛОВКОВ ТАБЛИЦЫ
@@ -110,20 +136,10 @@ class ResultsDialog(QDialog):
         self.delta_table.verticalHeader().setVisible(False)
         
         # ДЕЛАЕМ ТАБЛИЦУ НЕРЕДАКТИРУЕМОЙ
-        self.delta_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.delta_table.setSelectionMode(QTableWidget.NoSelection)
-        
-        for i, displacement in enumerate(self.U):
-            self.delta_table.setItem(i, 0, QTableWidgetItem(str(i + 1)))
-            # Убрана экспоненциальная форма
-            self.delta_table.setItem(i, 1, QTableWidgetItem(f"{displacement:.8f}"))
-            self.delta_table.setItem(i, 2, QTableWidgetItem(f"{displacement * 1000:.6f}"))
-            
-            # Делаем все ячейки нередактируемыми
-            for col in range(3):
-                item = self.delta_table.item(i, col)
-                if item:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+        self.delta_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.delta_table.setSelectionMode(QTableView.NoSelection)
+        
+        self.calculate_deltas()
         
         layout.addWidget(QLabel("Перемещения узлов конструкции:"))
         layout.addWidget(self.delta_table)
@@ -152,9 +168,9 @@ class ResultsDialog(QDialog):
         detailed_group = QGroupBox("Детальные результаты по стержням")
         
         # Таблица продольных сил
-        self.n_table = QTableWidget()
-        self.n_table.setColumnCount(3)
-        self.n_table.setHorizontalHeaderLabels(["Номер стержня", "Nx в начале стержня, Н", "Nx в конце стержня, Н"])
+        self.n_model = ArrayTableModel(["Номер стержня", "Nx в начале стержня, Н", "Nx в конце стержня, Н"], self)
+        self.n_table = QTableView()
+        self.n_table.setModel(self.n_model)
         self.n_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
         # СИНИЙ ЦВЕТ ДЛЯ ЗАГОЛОВКОВ ТАБЛИЦЫ
@@ -162,19 +178,19 @@ class ResultsDialog(QDialog):
             "QHeaderView::section { background-color: #2E5CB8; color: white; font-weight: bold; }"
         )
         
-        self.n_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.n_table.setSelectionMode(QTableWidget.NoSelection)
+        self.n_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.n_table.setSelectionMode(QTableView.NoSelection)
         
         # Таблица напряжений - УВЕЛИЧИВАЕМ КОЛИЧЕСТВО СТОЛБЦОВ ДО 5
-        self.sigma_table = QTableWidget()
-        self.sigma_table.setColumnCount(5)  # Было 4, стало 5
-        self.sigma_table.setHorizontalHeaderLabels([
+        self.sigma_model = ArrayTableModel([
             "Номер стержня", 
             "σx в начале стержня, Па", 
             "σx в конце стержня, Па", 
             "Допускаемое напряжение, Па",
             "Соответствие норме"  # НОВЫЙ СТОЛБЕЦ
-        ])
+        ], self)
+        self.sigma_table = QTableView()
+        self.sigma_table.setModel(self.sigma_model)
         self.sigma_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
         # СИНИЙ ЦВЕТ ДЛЯ ЗАГОЛОВКОВ ТАБЛИЦЫ
@@ -182,13 +198,13 @@ class ResultsDialog(QDialog):
             "QHeaderView::section { background-color: #2E5CB8; color: white; font-weight: bold; }"
         )
         
-        self.sigma_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.sigma_table.setSelectionMode(QTableWidget.NoSelection)
+        self.sigma_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.sigma_table.setSelectionMode(QTableView.NoSelection)
         
         # Таблица перемещений
-        self.u_table = QTableWidget()
-        self.u_table.setColumnCount(3)
-        self.u_table.setHorizontalHeaderLabels(["Номер стержня", "Ux в начале стержня, м", "Ux в конце стержня, м"])
+        self.u_model = ArrayTableModel(["Номер стержня", "Ux в начале стержня, м", "Ux в конце стержня, м"], self)
+        self.u_table = QTableView()
+        self.u_table.setModel(self.u_model)
         self.u_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
         # СИНИЙ ЦВЕТ ДЛЯ ЗАГОЛОВКОВ ТАБЛИЦЫ
@@ -196,8 +212,8 @@ class ResultsDialog(QDialog):
             "QHeaderView::section { background-color: #2E5CB8; color: white; font-weight: bold; }"
         )
         
-        self.u_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.u_table.setSelectionMode(QTableWidget.NoSelection)
+        self.u_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.u_table.setSelectionMode(QTableView.NoSelection)
         
         # Убираем нумерацию строк для всех таблиц
         self.n_table.verticalHeader().setVisible(False)
@@ -211,18 +227,32 @@ class ResultsDialog(QDialog):
         detail_selection_layout = QHBoxLayout()
         detail_selection_layout.addWidget(QLabel("Выберите стержень:"))
         self.detail_bar_combo = QComboBox()
-        for i, bar in enumerate(self.bars):
-            self.detail_bar_combo.addItem(f"Стержень {i+1} (L={bar['L']} м)")
         self.detail_bar_combo.currentIndexChanged.connect(self.update_detailed_table)
         detail_selection_layout.addWidget(self.detail_bar_combo)
+        
+        # Шаг или число точек на стержень
+        self.detail_mode_combo = QComboBox()
+        self.detail_mode_combo.addItems(["Шаг, м:", "Число точек:"])
+        self.detail_mode_combo.currentIndexChanged.connect(self.on_detail_mode_changed)
+        self.detail_step_input = QLineEdit(str(PostProcessor.DETAIL_STEP))
+        self.detail_step_input.setMaximumWidth(100)
+        self.detail_step_input.editingFinished.connect(self.update_detailed_table)
+        detail_selection_layout.addWidget(self.detail_mode_combo)
+        detail_selection_layout.addWidget(self.detail_step_input)
         detail_selection_layout.addStretch()
         
+        # Запись детальной таблицы всей конструкции в файл
+        self.detail_export_btn = QPushButton("💾 Вся конструкция в CSV")
+        self.detail_export_btn.setStyleSheet("background-color: #a2d4a2; font-weight:bold; padding:4px")
+        self.detail_export_btn.clicked.connect(self.export_detailed_csv)
+        detail_selection_layout.addWidget(self.detail_export_btn)
+        
         detailed_layout.addLayout(detail_selection_layout)
         
         # Таблица детальных результатов
-        self.detailed_table = QTableWidget()
-        self.detailed_table.setColumnCount(5)
-        self.detailed_table.setHorizontalHeaderLabels(["Индекс", "x, м", "Nx, Н", "σx, Па", "Ux, м"])
+        self.detailed_model = ArrayTableModel(["Индекс", "x, м", "Nx, Н", "σx, Па", "Ux, м"], self)
+        self.detailed_table = QTableView()
+        self.detailed_table.setModel(self.detailed_model)
         self.detailed_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
         # СИНИЙ ЦВЕТ ДЛЯ ЗАГОЛОВКОВ ТАБЛИЦЫ
@@ -230,8 +260,8 @@ class ResultsDialog(QDialog):
             "QHeaderView::section { background-color: #2E5CB8; color: white; font-weight: bold; }"
         )
         
-        self.detailed_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.detailed_table.setSelectionMode(QTableWidget.NoSelection)
+        self.detailed_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.detailed_table.setSelectionMode(QTableView.NoSelection)
         self.detailed_table.verticalHeader().setVisible(False)
         
         detailed_layout.addWidget(self.detailed_table)
@@ -258,48 +288,77 @@ class ResultsDialog(QDialog):
         
         self.tab_tables.setLayout(layout)
     
+    def detail_sampling(self):
+        """Шаг или число точек детальной таблицы из полей ввода"""
+        text = self.detail_step_input.text().strip()
+        try:
+            if self.detail_mode_combo.currentIndex() == 0:
+                return {'step': float(text)}
+            return {'points': int(text)}
+        except ValueError:
+            raise ValueError(f"'{text}' не является числом") from None
+    
+    def on_detail_mode_changed(self):
+        """Значение по умолчанию при переключении между шагом и числом точек"""
+        if self.detail_mode_combo.currentIndex() == 0:
+            self.detail_step_input.setText(str(PostProcessor.DETAIL_STEP))
+        else:
+            self.detail_step_input.setText(str(self.post.points_per_bar))
+        self.update_detailed_table()
+    
     def update_detailed_table(self):
-        """Обновление детальной таблицы при выборе стержня"""
+        """Обновление детальной таблицы при выборе стержня или шага"""
         bar_idx = self.detail_bar_combo.currentIndex()
         if bar_idx < 0 or bar_idx >= len(self.bars):
             return
-            
-        bar = self.bars[bar_idx]
-        L = bar['L']
-        A = bar['A']
-        
-        # Создаем точки с шагом 0.1 м
-        step = 0.1
-        x_points = np.arange(0, L + step, step)
-        # Убедимся, что последняя точка точно равна L
-        if x_points[-1] > L:
-            x_points[-1] = L
-        elif x_points[-1] < L:
-            x_points = np.append(x_points, L)
-        
-        # Создаем данные для таблицы
-        self.detailed_table.setRowCount(len(x_points))
-        
-        for i, x in enumerate(x_points):
-            # Расчет компонент НДС
-            Nx = self.N_coeffs[bar_idx][0] + x * self.N_coeffs[bar_idx][1]
-            sigma_x = Nx / A
-            Ux = (self.U_coeffs[bar_idx][0] + 
-                  x * self.U_coeffs[bar_idx][1] + 
-                  (x**2) * self.U_coeffs[bar_idx][2])
-            
-            # Заполняем строку таблицы
-            self.detailed_table.setItem(i, 0, QTableWidgetItem(str(i)))
-            self.detailed_table.setItem(i, 1, QTableWidgetItem(f"{x:.4f}"))
-            self.detailed_table.setItem(i, 2, QTableWidgetItem(f"{Nx:.4f}"))
-            self.detailed_table.setItem(i, 3, QTableWidgetItem(f"{sigma_x:.4f}"))
-            self.detailed_table.setItem(i, 4, QTableWidgetItem(f"{Ux:.8f}"))
-            
-            # Делаем все ячейки нередактируемыми
-            for col in range(5):
-                item = self.detailed_table.item(i, col)
-                if item:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+        
+        # Точки стержня считаются сразу, таблица форматирует только видимые строки
+        try:
+            sampling = self.detail_sampling()
+            rows = int(self.post.detailed_counts(bars=[bar_idx], **sampling)[0])
+        except ValueError as e:
+            QMessageBox.warning(self, "Ошибка", f"Некорректный шаг детальной таблицы: {e}")
+            return
+        if rows > self.MAX_DETAIL_ROWS:
+            QMessageBox.warning(self, "Ошибка",
+                                f"Слишком мелкий шаг: {rows} точек на стержне "
+                                f"(не больше {self.MAX_DETAIL_ROWS}). Для всей конструкции "
+                                f"используйте запись в CSV")
+            return
+        
+        samples = self.post.detailed_samples([bar_idx], **sampling)
+        self.detailed_model.set_columns([
+            (samples['index'], '{}'),
+            (samples['x_local'], '{:.4f}'),
+            (samples['Nx'], '{:.4f}'),
+            (samples['σx'], '{:.4f}'),
+            (samples['Ux'], '{:.8f}'),
+        ])
+    
+    def export_detailed_csv(self):
+        """Потоковая запись детальной таблицы всей конструкции в CSV с текущим шагом"""
+        try:
+            sampling = self.detail_sampling()
+            self.post.validate_sampling(**sampling)
+        except ValueError as e:
+            QMessageBox.warning(self, "Ошибка", f"Некорректный шаг детальной таблицы: {e}")
+            return
+        
+        filename, _ = QFileDialog.getSaveFileName(self, 'Сохранить детальную таблицу', filter='*.csv')
+        if not filename:
+            return
+        if not filename.endswith('.csv'):
+            filename += '.csv'
+        
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            rows = self.post.write_detailed_csv(filename, **sampling)
+        except Exception as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.critical(self, "Ошибка", f"Ошибка при сохранении таблицы:\n{str(e)}")
+            return
+        QApplication.restoreOverrideCursor()
+        QMessageBox.information(self, "Успех", f"Детальная таблица ({rows} строк) сохранена в файл:\n{filename}")
     
     def setup_tab_section(self):
         layout = QVBoxLayout()
@@ -310,8 +369,6 @@ class ResultsDialog(QDialog):
         
         # Выбор элемента
         self.element_combo = QComboBox()
-        for i, bar in enumerate(self.bars):
-            self.element_combo.addItem(f"Стержень {i+1} (L={bar['L']} м, A={bar['A']} м²)")
         
         # Ввод локальной координаты
         self.local_coord_input = QLineEdit()
@@ -394,12 +451,12 @@ class ResultsDialog(QDialog):
             return
         
         # Расчет глобальной координаты
-        x_global = sum(bar['L'] for bar in self.bars[:element_idx]) + x_local
+        x_global = self.bars.node_positions[element_idx] + x_local
         
         # Расчет компонент НДС
-        Nx = self.N_coeffs[element_idx][0] + x_local * self.N_coeffs[element_idx][1]
+        Nx = self.N_coeffs[element_idx, 0] + x_local * self.N_coeffs[element_idx, 1]
         sigma_x = Nx / bar['A']
-        Ux = self.U_coeffs[element_idx][0] + x_local * self.U_coeffs[element_idx][1] + (x_local**2) * self.U_coeffs[element_idx][2]
+        Ux = self.U_coeffs[element_idx, 0] + x_local * self.U_coeffs[element_idx, 1] + (x_local**2) * self.U_coeffs[element_idx, 2]
         
         # Проверка соответствия допустимому напряжению
         sigma_allowable = bar['sigma']
@@ -422,98 +479,137 @@ class ResultsDialog(QDialog):
         self.section_Ux.setText(f"{Ux:.8f}")
     
     def calculate_all_results(self):
-        """Расчет всех результатов для отображения"""
-        self.calculate_plots()
+        """
+        Сброс построенных вкладок и построение текущей
+        Остальные вкладки строятся при первом открытии
+        """
+        self._loaded_tabs.clear()
+        self.ensure_tab_loaded(self.tabs.currentIndex())
+    
+    def ensure_tab_loaded(self, index):
+        """Построение содержимого вкладки index, если оно ещё не построено"""
+        tab = self.tabs.widget(index)
+        loader = self._tab_loaders.get(tab)
+        if loader is None or tab in self._loaded_tabs:
+            return
+        self._loaded_tabs.add(tab)
+        loader()
+    
+    def load_tab_tables(self):
+        """Заполнение вкладки таблиц результатов"""
+        self.detail_bar_combo.blockSignals(True)
+        self.detail_bar_combo.clear()
+        self.detail_bar_combo.addItems([
+            f"Стержень {i+1} (L={L} м)" for i, L in enumerate(self.bars.L.tolist())
+        ])
+        self.detail_bar_combo.blockSignals(False)
         self.calculate_tables()
         self.update_detailed_table()  # Инициализируем детальную таблицу
     
-    def calculate_plots(self):
-        """Расчет и отображение графиков эпюр с глобальными координатами под каждым эпюром"""
-        self.fig.clear()
-        
+    def load_tab_section(self):
+        """Заполнение списка элементов на вкладке расчёта в сечении"""
+        # Результаты предыдущего расчёта в сечении больше не действительны
+        for label in [self.section_element, self.section_local_coord, self.section_global_coord,
+                      self.section_Nx, self.section_sigma, self.section_sigma_allowable,
+                      self.section_compliance, self.section_Ux]:
+            label.setText("-")
+        self.element_combo.clear()
+        self.element_combo.addItems([
+            f"Стержень {i+1} (L={L} м, A={A} м²)"
+            for i, (L, A) in enumerate(zip(self.bars.L.tolist(), self.bars.A.tolist()))
+        ])
+    
+    def setup_plot_artists(self):
+        """
+        Однократное создание осей и постоянных художников эпюр
+        При пересчёте и масштабировании меняются только их данные
+        """
         # Устанавливаем размер фигуры
         self.fig.set_size_inches(12, 10)
         
-        # Рассчитываем общую длину конструкции и позиции узлов
-        total_length = sum(bar['L'] for bar in self.bars)
-        node_positions = [0]
-        for bar in self.bars:
-            node_positions.append(node_positions[-1] + bar['L'])
-        
-        # Создаем 3 subplot для эпюр с увеличенными вертикальными отступами
+        # Создаем 3 subplot для эпюр с общей осью X
         gs = self.fig.add_gridspec(3, 1, height_ratios=[1, 1, 1])
-        
-        # Subplot для эпюр
         ax1 = self.fig.add_subplot(gs[0])
-        ax2 = self.fig.add_subplot(gs[1])
-        ax3 = self.fig.add_subplot(gs[2])
-        
-        # Подготовка данных для графиков
-        x_global = []
-        Nx_values = []
-        sigma_values = []
-        Ux_values = []
-        
-        current_position = 0
-        for i, bar in enumerate(self.bars):
-            # Увеличиваем количество точек для более гладких графиков
-            x_local = np.linspace(0, bar['L'], int(200 * bar['L'] / total_length))
+        ax2 = self.fig.add_subplot(gs[1], sharex=ax1)
+        ax3 = self.fig.add_subplot(gs[2], sharex=ax1)
+        self.plot_axes = [ax1, ax2, ax3]
+        
+        ax1.set_title('Эпюра продольных сил Nx', fontsize=12, fontweight='bold', pad=20)
+        ax1.set_ylabel('Nx, Н', fontsize=10, labelpad=10)
+        ax2.set_title('Эпюра нормальных напряжений σx', fontsize=12, fontweight='bold', pad=20)
+        ax2.set_ylabel('σx, Па', fontsize=10, labelpad=10)
+        ax3.set_title('Эпюра перемещений Ux', fontsize=12, fontweight='bold', pad=20)
+        ax3.set_ylabel('Ux, м', fontsize=10, labelpad=10)
+        ax3.set_xlabel('Координата x, м', fontsize=10, labelpad=10)
+        
+        self.plot_layers = []
+        for ax, component, color, label_color, fmt in (
+            (ax1, 'Nx', 'red', 'darkred', '{:.2f}'),
+            (ax2, 'σx', 'blue', 'darkblue', '{:.2f}'),
+            (ax3, 'Ux', 'green', 'darkgreen', '{:.6f}'),
+        ):
+            ax.grid(True, alpha=0.3)
+            ax.tick_params(axis='both', which='major', labelsize=8)
+            # Убедимся, что оси X отображаются для всех графиков
+            ax.tick_params(axis='x', which='both', labelbottom=True)
             
-            for x in x_local:
-                global_x = current_position + x
-                x_global.append(global_x)
-                
-                # Расчет по коэффициентам
-                Nx = self.N_coeffs[i][0] + x * self.N_coeffs[i][1]
-                Nx_values.append(Nx)
-                
-                sigma_values.append(Nx / bar['A'])
-                
-                # Расчет перемещений
-                Ux = (self.U_coeffs[i][0] + 
-                    x * self.U_coeffs[i][1] + 
-                    (x**2) * self.U_coeffs[i][2])
-                Ux_values.append(Ux)
+            # Вертикальные линии узлов и основных делений одной ломаной с разрывами NaN
+            # (x в данных, y в долях оси)
+            tick_lines, = ax.plot([], [], color='gray', linestyle=':', alpha=0.3, linewidth=0.5,
+                                  transform=ax.get_xaxis_transform(), scalex=False, scaley=False)
+            node_lines, = ax.plot([], [], color='k', linestyle='-', alpha=0.5, linewidth=1,
+                                  transform=ax.get_xaxis_transform(), scalex=False, scaley=False)
             
-            current_position += bar['L']
-        
-        # Устанавливаем одинаковые пределы по X для всех subplot
-        x_min = 0
-        x_max = total_length
-        
-        # Связываем оси X всех subplot
-        ax1.set_xlim(x_min, x_max)
-        ax2.set_xlim(x_min, x_max)
-        ax3.set_xlim(x_min, x_max)
-        
-        # Эпюра Nx с увеличенными отступами для заголовка
-        ax1.plot(x_global, Nx_values, 'r-', linewidth=2)
-        ax1.set_title('Эпюра продольных сил Nx', fontsize=12, fontweight='bold', pad=20)  # Увеличен pad
-        ax1.set_ylabel('Nx, Н', fontsize=10, labelpad=10)  # Добавлен labelpad
-        ax1.grid(True, alpha=0.3)
-        ax1.fill_between(x_global, Nx_values, alpha=0.3, color='red')
-        
-        # Эпюра σx с увеличенными отступами для заголовка
-        ax2.plot(x_global, sigma_values, 'b-', linewidth=2)
-        ax2.set_title('Эпюра нормальных напряжений σx', fontsize=12, fontweight='bold', pad=20)  # Увеличен pad
-        ax2.set_ylabel('σx, Па', fontsize=10, labelpad=10)  # Добавлен labelpad
-        ax2.grid(True, alpha=0.3)
-        ax2.fill_between(x_global, sigma_values, alpha=0.3, color='blue')
-        
-        # Эпюра Ux с увеличенными отступами для заголовка
-        ax3.plot(x_global, Ux_values, 'g-', linewidth=2)
-        ax3.set_title('Эпюра перемещений Ux', fontsize=12, fontweight='bold', pad=20)  # Увеличен pad
-        ax3.set_ylabel('Ux, м', fontsize=10, labelpad=10)  # Добавлен labelpad
-        ax3.set_xlabel('Координата x, м', fontsize=10, labelpad=10)  # Добавлен labelpad
-        ax3.grid(True, alpha=0.3)
-        ax3.fill_between(x_global, Ux_values, alpha=0.3, color='green')
-        
-        # Добавляем вертикальные линии в местах узлов
-        for pos in node_positions:
-            for ax in [ax1, ax2, ax3]:
-                ax.axvline(x=pos, color='k', linestyle='-', alpha=0.5, linewidth=1)
-        
-        # ДОБАВЛЯЕМ ПОДПИСИ ГЛОБАЛЬНЫХ КООРДИНАТ ПОД КАЖДЫМ ЭПЮРОМ
+            fill = PathPatch(PostProcessor.fill_path([]), facecolor=color, edgecolor='none', alpha=0.3)
+            line = LineCollection([], colors=color, linewidths=2)
+            ax.add_artist(fill)
+            ax.add_collection(line, autolim=False)
+            
+            # Пул подписей значений, переиспользуемый при изменении масштаба
+            labels = []
+            for _ in range(self.MAX_VALUE_LABELS):
+                annotation = ax.annotate(
+                    '', xy=(0, 0), xytext=(5, 5),
+                    textcoords='offset points', fontsize=8, color=label_color,
+                    bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7),
+                    arrowprops=dict(arrowstyle='->', color=label_color, lw=0.5))
+                annotation.set_visible(False)
+                labels.append(annotation)
+            
+            self.plot_layers.append({
+                'ax': ax, 'component': component, 'fmt': fmt,
+                'line': line, 'fill': fill, 'node_lines': node_lines, 'tick_lines': tick_lines,
+                'labels': labels, 'x': np.empty(0), 'y': np.empty(0),
+            })
+        
+        # Обеспечиваем одинаковое соотношение сторон для всех графиков
+        # Увеличиваем отступы со всех сторон, особенно сверху и снизу
+        self.fig.tight_layout(rect=[0.03, 0.03, 0.97, 0.97], pad=4.0, h_pad=3.0)
+        
+        # Оси X общие, поэтому изменение масштаба приходит от любой из осей
+        for ax in self.plot_axes:
+            ax.callbacks.connect('xlim_changed', lambda event_ax: self.update_value_labels())
+        self.canvas.mpl_connect('resize_event', lambda event: self.update_value_labels())
+        
+        # Масштабирование колесом и панорамирование перетаскиванием с блиттингом
+        self._blit_background = None
+        self._pan_start = None
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.timeout.connect(self.finish_plot_interaction)
+        self.canvas.mpl_connect('scroll_event', self.on_plot_scroll)
+        self.canvas.mpl_connect('button_press_event', self.on_plot_press)
+        self.canvas.mpl_connect('motion_notify_event', self.on_plot_motion)
+        self.canvas.mpl_connect('button_release_event', self.on_plot_release)
+    
+    def calculate_plots(self):
+        """Расчет и отображение графиков эпюр с глобальными координатами под каждым эпюром"""
+        if not hasattr(self, 'plot_layers'):
+            self.setup_plot_artists()
+        
+        # Рассчитываем общую длину конструкции и позиции узлов
+        total_length = self.total_length
+        node_positions = self.bars.node_positions
         
         # Определяем шаг для делений в зависимости от общей длины
         if total_length <= 2:
@@ -525,192 +621,255 @@ class ResultsDialog(QDialog):
         
         # Создаем равномерные деления с выбранным шагом
         x_ticks = np.arange(0, total_length + step/2, step)
-        
-        # Устанавливаем деления на оси X для ВСЕХ графиков
-        for ax in [ax1, ax2, ax3]:
-            ax.set_xticks(x_ticks)
-            ax.set_xticklabels([f'{x:.2f}' for x in x_ticks], fontsize=8)
-        
-        # Добавляем вертикальные линии для основных делений
-        for x in x_ticks:
-            if x not in node_positions:  # Узлы уже отмечены
-                for ax in [ax1, ax2, ax3]:
-                    ax.axvline(x=x, color='gray', linestyle=':', alpha=0.3, linewidth=0.5)
-        
-        # Улучшаем читаемость подписей осей
-        for ax in [ax1, ax2, ax3]:
-            ax.tick_params(axis='both', which='major', labelsize=8)
-            # Убедимся, что оси X отображаются для всех графиков
-            ax.tick_params(axis='x', which='both', labelbottom=True)
-        
-        # Убираем подписи осей X для верхних графиков
-        ax1.set_xlabel('')
-        ax2.set_xlabel('')
-        
-        # ДОБАВЛЯЕМ ПОДПИСИ ЗНАЧЕНИЙ В НАЧАЛЕ И КОНЦЕ СТЕРЖНЕЙ
-        
-        # Вычисляем значения в узлах для каждого стержня
-        current_position = 0
-        for i, bar in enumerate(self.bars):
-            L = bar['L']
-            A = bar['A']
-            
-            # Координаты начала и конца стержня
-            x_start = current_position
-            x_end = current_position + L
-            
-            # Значения в начале стержня (x=0)
-            Nx_start = self.N_coeffs[i][0]
-            sigma_start = Nx_start / A
-            Ux_start = self.U_coeffs[i][0]
-            
-            # Значения в конце стержня (x=L)
-            Nx_end = self.N_coeffs[i][0] + L * self.N_coeffs[i][1]
-            sigma_end = Nx_end / A
-            Ux_end = self.U_coeffs[i][0] + L * self.U_coeffs[i][1] + (L**2) * self.U_coeffs[i][2]
-            
-            # Подписи для эпюры Nx
-            ax1.annotate(f'{Nx_start:.2f}', xy=(x_start, Nx_start), xytext=(5, 5),
-                        textcoords='offset points', fontsize=8, color='darkred',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7),
-                        arrowprops=dict(arrowstyle='->', color='darkred', lw=0.5))
-            
-            ax1.annotate(f'{Nx_end:.2f}', xy=(x_end, Nx_end), xytext=(5, 5),
-                        textcoords='offset points', fontsize=8, color='darkred',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7),
-                        arrowprops=dict(arrowstyle='->', color='darkred', lw=0.5))
+        # Узлы уже отмечены, поэтому для них дополнительные линии не нужны
+        free_ticks = x_ticks[~np.isin(x_ticks, node_positions)]
+        node_lines = self.vertical_lines(node_positions)
+        tick_lines = self.vertical_lines(free_ticks)
+        
+        # Значения на концах всех стержней; координаты идут по возрастанию:
+        # начало 1-го, конец 1-го, начало 2-го, ...
+        x_ends = np.stack([node_positions[:-1], node_positions[1:]], axis=1).ravel()
+        ends = self.post.bar_end_values()
+        
+        for layer in self.plot_layers:
+            ax = layer['ax']
+            segments, fills = self.post.epure_geometry(layer['component'])
+            layer['line'].set_segments(segments)
+            layer['fill'].set_path(PostProcessor.fill_path(fills))
+            layer['node_lines'].set_data(*node_lines)
+            layer['tick_lines'].set_data(*tick_lines)
+            layer['x'] = x_ends
+            layer['y'] = ends[layer['component']].ravel()
             
-            # Подписи для эпюры σx
-            ax2.annotate(f'{sigma_start:.2f}', xy=(x_start, sigma_start), xytext=(5, 5),
-                        textcoords='offset points', fontsize=8, color='darkblue',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7),
-                        arrowprops=dict(arrowstyle='->', color='darkblue', lw=0.5))
-            
-            ax2.annotate(f'{sigma_end:.2f}', xy=(x_end, sigma_end), xytext=(5, 5),
-                        textcoords='offset points', fontsize=8, color='darkblue',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7),
-                        arrowprops=dict(arrowstyle='->', color='darkblue', lw=0.5))
+            # Пределы по Y с запасом как при автомасштабировании, заливка идёт от нуля
+            values = segments[..., 1]
+            y_min = min(0.0, values.min()) if values.size else 0.0
+            y_max = max(0.0, values.max()) if values.size else 0.0
+            margin = 0.05 * (y_max - y_min) or 1.0
+            ax.set_ylim(y_min - margin, y_max + margin)
+        
+        # Оси X общие: пределы и деления достаточно задать один раз
+        ax1 = self.plot_axes[0]
+        ax1.set_xticks(x_ticks)
+        ax1.set_xticklabels([f'{x:.2f}' for x in x_ticks], fontsize=8)
+        ax1.set_xlim(0, total_length)
+        
+        self.update_value_labels(draw=False)
+        self.canvas.draw_idle()
+    
+    @staticmethod
+    def vertical_lines(x):
+        """Координаты вертикальных линий через всю высоту оси, разделённых NaN"""
+        xs = np.repeat(x, 3).astype(float)
+        ys = np.tile([0.0, 1.0, np.nan], len(x))
+        xs[2::3] = np.nan
+        return xs, ys
+    
+    def update_results(self, U, N_coeffs, U_coeffs, bars=None, supports=None, node_forces=None, post=None):
+        """
+        Обновление результатов после повторного расчёта без пересоздания окна:
+        оси и художники эпюр сохраняются, меняются только их данные
+        post - постпроцессор, подготовленный фоновым расчётом
+        """
+        if bars is not None:
+            self.bars = BarSet.coerce(bars)
+            self.total_length = self.bars.total_length
+        if supports is not None:
+            self.supports = supports
+        if node_forces is not None:
+            self.node_forces = node_forces
+        self.U = np.asarray(U, dtype=float)
+        self.N_coeffs = np.asarray(N_coeffs, dtype=float).reshape(-1, 2)
+        self.U_coeffs = np.asarray(U_coeffs, dtype=float).reshape(-1, 3)
+        if post is not None:
+            self.post = post
+        else:
+            self.post.kernels = self.bars
+            self.post.N = self.N_coeffs
+            self.post.U = self.U_coeffs
+        self.calculate_deltas()
+        self.calculate_all_results()
+    
+    def update_value_labels(self, draw=True):
+        """
+        Уровень детализации подписей значений на эпюрах
+        Подписываются только концы стержней в видимом диапазоне X,
+        подписи, перекрывающиеся на экране, пропускаются,
+        на каждой оси не более MAX_VALUE_LABELS подписей
+        """
+        # Во время панорамирования подписи скрыты и обновляются по его окончании
+        if getattr(self, '_blit_background', None) is not None:
+            return
+        
+        px_per_pt = self.fig.dpi / 72
+        offset = 5 * px_per_pt
+        height = 8 * 1.8 * px_per_pt
+        
+        for layer in getattr(self, 'plot_layers', []):
+            ax = layer['ax']
+            x, y = layer['x'], layer['y']
+            x_min, x_max = sorted(ax.get_xlim())
+            lo = np.searchsorted(x, x_min, side='left')
+            hi = np.searchsorted(x, x_max, side='right')
+            candidates = np.arange(lo, hi)
+            # При большом числе видимых точек перебираем равномерную подвыборку
+            limit = 4 * self.MAX_VALUE_LABELS
+            if len(candidates) > limit:
+                candidates = candidates[np.linspace(0, len(candidates) - 1, limit).astype(int)]
             
-            # Подписи для эпюры Ux
-            ax3.annotate(f'{Ux_start:.6f}', xy=(x_start, Ux_start), xytext=(5, 5),
-                        textcoords='offset points', fontsize=8, color='darkgreen',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7),
-                        arrowprops=dict(arrowstyle='->', color='darkgreen', lw=0.5))
+            # Экранные координаты и примерные размеры подписей в пикселях
+            points = ax.transData.transform(np.column_stack([x[candidates], y[candidates]]))
             
-            ax3.annotate(f'{Ux_end:.6f}', xy=(x_end, Ux_end), xytext=(5, 5),
-                        textcoords='offset points', fontsize=8, color='darkgreen',
-                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7),
-                        arrowprops=dict(arrowstyle='->', color='darkgreen', lw=0.5))
+            # Жадный отбор слева направо без перекрытий
+            placed = []
+            for (px, py), index in zip(points, candidates):
+                text = layer['fmt'].format(y[index])
+                width = (len(text) * 8 * 0.6 + 6) * px_per_pt
+                left, bottom = px + offset, py + offset
+                if any(left < r and left + width > l and bottom < t and bottom + height > b
+                       for l, b, r, t in placed[-8:]):
+                    continue
+                annotation = layer['labels'][len(placed)]
+                annotation.set_text(text)
+                annotation.xy = (x[index], y[index])
+                annotation.set_visible(True)
+                placed.append((left, bottom, left + width, bottom + height))
+                if len(placed) >= self.MAX_VALUE_LABELS:
+                    break
             
-            current_position += L
+            for annotation in layer['labels'][len(placed):]:
+                annotation.set_visible(False)
         
-        # Обеспечиваем одинаковое соотношение сторон для всех графиков
-        # Увеличиваем отступы со всех сторон, особенно сверху и снизу
-        self.fig.tight_layout(rect=[0.03, 0.03, 0.97, 0.97], pad=4.0, h_pad=3.0)
+        if draw:
+            self.canvas.draw_idle()
+    
+    def dynamic_plot_artists(self):
+        """Художники, перерисовываемые при панорамировании поверх сохранённого фона"""
+        for layer in self.plot_layers:
+            yield layer['ax'], layer['fill']
+            yield layer['ax'], layer['line']
+            yield layer['ax'], layer['node_lines']
+            yield layer['ax'], layer['tick_lines']
+    
+    def start_plot_interaction(self):
+        """
+        Начало панорамирования или масштабирования: фон без эпюр и подписей
+        отрисовывается один раз и сохраняется
+        """
+        if self._blit_background is not None:
+            return
+        for layer in self.plot_layers:
+            for annotation in layer['labels']:
+                annotation.set_visible(False)
+        for _, artist in self.dynamic_plot_artists():
+            artist.set_animated(True)
+        self.canvas.draw()
+        self._blit_background = self.canvas.copy_from_bbox(self.fig.bbox)
+    
+    def blit_plots(self):
+        """Быстрая перерисовка эпюр поверх сохранённого фона"""
+        self.canvas.restore_region(self._blit_background)
+        for ax, artist in self.dynamic_plot_artists():
+            ax.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+    
+    def finish_plot_interaction(self):
+        """Окончание панорамирования: полная перерисовка с делениями и подписями"""
+        if self._blit_background is None:
+            return
+        self._blit_background = None
+        for _, artist in self.dynamic_plot_artists():
+            artist.set_animated(False)
+        self.update_value_labels()
+    
+    def on_plot_scroll(self, event):
+        """Масштабирование колесом мыши относительно курсора"""
+        if event.inaxes not in self.plot_axes or event.xdata is None:
+            return
+        factor = 1 / 1.2 if event.button == 'up' else 1.2
+        x_min, x_max = self.plot_axes[0].get_xlim()
+        x = event.xdata
+        self.start_plot_interaction()
+        self.plot_axes[0].set_xlim(x - (x - x_min) * factor, x + (x_max - x) * factor)
+        self.blit_plots()
+        # Полная перерисовка после паузы в прокрутке
+        self._zoom_timer.start(200)
+    
+    def on_plot_press(self, event):
+        """Начало панорамирования левой кнопкой мыши"""
+        if event.button != 1 or event.inaxes not in self.plot_axes:
+            return
+        bbox = event.inaxes.get_window_extent()
+        x_min, x_max = event.inaxes.get_xlim()
+        self._pan_start = (event.x, x_min, x_max, (x_max - x_min) / bbox.width)
+        self.start_plot_interaction()
+    
+    def on_plot_motion(self, event):
+        """Панорамирование: сдвиг пределов и блиттинг эпюр"""
+        if self._pan_start is None:
+            return
+        x0, x_min, x_max, scale = self._pan_start
+        dx = (event.x - x0) * scale
+        self.plot_axes[0].set_xlim(x_min - dx, x_max - dx)
+        self.blit_plots()
+    
+    def on_plot_release(self, event):
+        """Окончание панорамирования"""
+        if self._pan_start is None:
+            return
+        self._pan_start = None
+        self.finish_plot_interaction()
+        
+    def calculate_deltas(self):
+        """Заполнение таблицы перемещений узлов"""
+        self.info_label.setText(f"Конструкция состоит из {len(self.bars)} стержней и {len(self.U)} узлов")
+        # Убрана экспоненциальная форма
+        self.delta_model.set_columns([
+            (range(1, len(self.U) + 1), '{}'),
+            (self.U, '{:.8f}'),
+            (self.U * 1000, '{:.6f}'),
+        ])
+    
+    def calculate_tables(self):
+        """Заполнение таблиц результатов для начальных и конечных точек стержней"""
+        # Значения в начале (x=0) и конце (x=L) всех стержней из общего кэша постпроцессора
+        ends = self.post.bar_end_values()
+        Nx_start_values, Nx_end_values = ends['Nx'].T
+        sigma_start_values, sigma_end_values = ends['σx'].T
+        Ux_start_values, Ux_end_values = ends['Ux'].T
         
-        # Синхронизируем масштабирование по оси X
-        def on_xlim_changed(event_ax):
-            xlim = event_ax.get_xlim()
-            for ax in [ax1, ax2, ax3]:
-                if ax != event_ax:
-                    ax.set_xlim(xlim)
+        # Максимальное по модулю напряжение в каждом стержне
+        max_sigma_values = np.maximum(np.abs(sigma_start_values), np.abs(sigma_end_values))
+        # Проверяем соответствие допустимому напряжению из входных данных
+        compliance = max_sigma_values <= self.bars.sigma
         
-        # Подключаем обработчики изменения масштаба
-        ax1.callbacks.connect('xlim_changed', on_xlim_changed)
-        ax2.callbacks.connect('xlim_changed', on_xlim_changed)
-        ax3.callbacks.connect('xlim_changed', on_xlim_changed)
+        numbers = range(1, len(self.bars) + 1)
         
-        self.canvas.draw()
+        # Таблица продольных сил
+        self.n_model.set_columns([
+            (numbers, '{}'),
+            (Nx_start_values, '{:.4f}'),
+            (Nx_end_values, '{:.4f}'),
+        ])
         
-    def calculate_tables(self):
-        """Заполнение таблиц результатов для начальных и конечных точек стержней"""
-        n_data = []
-        sigma_data = []
-        u_data = []
-        
-        for i, bar in enumerate(self.bars):
-            L = bar['L']
-            A = bar['A']
-            E = bar['E']
-            sigma_allowable = bar['sigma']  # Допускаемое напряжение из входных данных
-            
-            # Расчет для начала стержня (x=0)
-            Nx_start = self.N_coeffs[i][0] + 0 * self.N_coeffs[i][1]  # N(x) = N0 + N1*x при x=0
-            sigma_start = Nx_start / A  # σ = N/A
-            
-            # Расчет для конца стержня (x=L)
-            Nx_end = self.N_coeffs[i][0] + L * self.N_coeffs[i][1]  # N(x) = N0 + N1*x при x=L
-            sigma_end = Nx_end / A  # σ = N/A
-            
-            # Определяем максимальное по модулю напряжение в стержне
-            max_sigma = max(abs(sigma_start), abs(sigma_end))
-            
-            # Проверяем соответствие допустимому напряжению
-            if max_sigma <= sigma_allowable:
-                compliance = "✅ Да"
-                compliance_color = "green"
-            else:
-                compliance = "❌ Нет"
-                compliance_color = "red"
-            
-            # Перемещения в начале и конце стержня
-            Ux_start = self.U_coeffs[i][0]  # u(x) = u0 + u1*x + u2*x² при x=0
-            Ux_end = self.U_coeffs[i][0] + L * self.U_coeffs[i][1] + (L**2) * self.U_coeffs[i][2]  # при x=L
-            
-            # Данные для таблицы продольных сил
-            n_data.append([
-                str(i + 1),
-                f"{Nx_start:.4f}",
-                f"{Nx_end:.4f}"
-            ])
-            
-            # Данные для таблицы напряжений (теперь 5 столбцов)
-            sigma_data.append([
-                str(i + 1),
-                f"{sigma_start:.4f}",
-                f"{sigma_end:.4f}",
-                f"{sigma_allowable:.4f}",
-                compliance  # НОВЫЙ СТОЛБЕЦ
-            ])
-            
-            # Данные для таблицы перемещений
-            u_data.append([
-                str(i + 1),
-                f"{Ux_start:.8f}",
-                f"{Ux_end:.8f}"
-            ])
-        
-        # Заполняем таблицу продольных сил
-        self.n_table.setRowCount(len(n_data))
-        for row, data in enumerate(n_data):
-            for col, value in enumerate(data):
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.n_table.setItem(row, col, item)
-        
-        # Заполняем таблицу напряжений
-        self.sigma_table.setRowCount(len(sigma_data))
-        for row, data in enumerate(sigma_data):
-            for col, value in enumerate(data):
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                
-                # Окрашиваем ячейку с проверкой соответствия
-                if col == 4:  # Столбец "Соответствие норме"
-                    if "✅" in value:
-                        item.setBackground(QColor(200, 255, 200))  # Зеленый фон для "Да"
-                    else:
-                        item.setBackground(QColor(255, 200, 200))  # Красный фон для "Нет"
-                
-                self.sigma_table.setItem(row, col, item)
-        
-        # Заполняем таблицу перемещений
-        self.u_table.setRowCount(len(u_data))
-        for row, data in enumerate(u_data):
-            for col, value in enumerate(data):
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.u_table.setItem(row, col, item)
+        # Таблица напряжений (5 столбцов); ячейка соответствия норме окрашивается
+        self.sigma_model.set_columns([
+            (numbers, '{}'),
+            (sigma_start_values, '{:.4f}'),
+            (sigma_end_values, '{:.4f}'),
+            (self.bars.sigma, '{:.4f}'),
+            (compliance, lambda ok: "✅ Да" if ok else "❌ Нет"),
+        ], backgrounds={
+            # Зеленый фон для "Да", красный для "Нет"
+            4: lambda ok: QColor(200, 255, 200) if ok else QColor(255, 200, 200),
+        })
+        
+        # Таблица перемещений
+        self.u_model.set_columns([
+            (numbers, '{}'),
+            (Ux_start_values, '{:.8f}'),
+            (Ux_end_values, '{:.8f}'),
+        ])
     
     def save_report(self):
         """Сохранение полного отчёта в PDF"""
@@ -753,6 +912,9 @@ class ResultsDialog(QDialog):
             with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
                 temp_plot_path = tmp.name
 
+            # Эпюры могли ещё не строиться, если вкладка не открывалась
+            self.ensure_tab_loaded(self.tabs.indexOf(self.tab_plots))
+            
             # Сохраняем графики в временный файл
             self.fig.savefig(temp_plot_path, dpi=150, bbox_inches='tight', format='png')
             
@@ -854,11 +1016,9 @@ class ResultsDialog(QDialog):
             
             # Таблица продольных сил
             elements.append(Paragraph("Продольные силы Nx", heading_style))
+            ends = self.post.bar_end_values()
             n_data = [["Номер стержня", "Nx в начале, Н", "Nx в конце, Н"]]
-            for i, bar in enumerate(self.bars):
-                L = bar['L']
-                Nx_start = self.N_coeffs[i][0] + 0 * self.N_coeffs[i][1]
-                Nx_end = self.N_coeffs[i][0] + L * self.N_coeffs[i][1]
+            for i, (Nx_start, Nx_end) in enumerate(ends['Nx'].tolist()):
                 n_data.append([str(i+1), f"{Nx_start:.4f}", f"{Nx_end:.4f}"])
             
             n_table = Table(n_data, colWidths=[30*mm, 50*mm, 50*mm])
@@ -881,16 +1041,8 @@ class ResultsDialog(QDialog):
             elements.append(Paragraph("Нормальные напряжения σx", heading_style))
             sigma_data = [["Номер стержня", "σx в начале, Па", "σx в конце, Па", "Допускаемое напряжение, Па", "Соответствие норме"]]
 
-            for i, bar in enumerate(self.bars):
-                L = bar['L']
-                A = bar['A']
-                sigma_allowable = bar['sigma']
-                
-                # Расчет напряжений в начале и конце стержня
-                Nx_start = self.N_coeffs[i][0] + 0 * self.N_coeffs[i][1]
-                Nx_end = self.N_coeffs[i][0] + L * self.N_coeffs[i][1]
-                sigma_start = Nx_start / A
-                sigma_end = Nx_end / A
+            for i, ((sigma_start, sigma_end), sigma_allowable) in enumerate(
+                    zip(ends['σx'].tolist(), self.bars.sigma.tolist())):
                 
                 # Определяем максимальное по модулю напряжение в стержне
                 max_sigma = max(abs(sigma_start), abs(sigma_end))
@@ -929,10 +1081,7 @@ class ResultsDialog(QDialog):
             # Таблица перемещений стержней
             elements.append(Paragraph("Перемещения стержней Ux", heading_style))
             u_data = [["Номер стержня", "Ux в начале, м", "Ux в конце, м"]]
-            for i, bar in enumerate(self.bars):
-                L = bar['L']
-                Ux_start = self.U_coeffs[i][0]
-                Ux_end = self.U_coeffs[i][0] + L * self.U_coeffs[i][1] + (L**2) * self.U_coeffs[i][2]
+            for i, (Ux_start, Ux_end) in enumerate(ends['Ux'].tolist()):
                 u_data.append([str(i+1), f"{Ux_start:.8f}", f"{Ux_end:.8f}"])
             
             u_table = Table(u_data, colWidths=[30*mm, 60*mm, 60*mm])
@@ -954,6 +1103,21 @@ class ResultsDialog(QDialog):
             elements.append(PageBreak())  # Новый раздел на новой странице
             elements.append(Paragraph("4. ДЕТАЛЬНЫЕ РЕЗУЛЬТАТЫ ПО СТЕРЖНЯМ", heading_style))
             
+            # Шаг детальной таблицы окна; при слишком мелком шаге в отчёт идёт
+            # points_per_bar точек на стержень. Точки считаются отдельно для каждого стержня
+            try:
+                sampling = self.detail_sampling()
+                report_rows = self.post.detailed_counts(**sampling).sum()
+            except ValueError:
+                sampling = {}
+                report_rows = self.post.detailed_counts().sum()
+            if report_rows > self.MAX_REPORT_ROWS:
+                sampling = {'points': self.post.points_per_bar}
+                elements.append(Paragraph(
+                    f"Шаг детальной таблицы даёт {report_rows} строк (больше {self.MAX_REPORT_ROWS}), "
+                    f"в отчёт включено по {self.post.points_per_bar} точек на стержень",
+                    normal_style))
+            
             for bar_idx, bar in enumerate(self.bars):
                 L = bar['L']
                 A = bar['A']
@@ -961,33 +1125,15 @@ class ResultsDialog(QDialog):
                 # Подзаголовок для текущего стержня
                 elements.append(Paragraph(f"Стержень {bar_idx+1} (L={L:.3f} м, A={A:.6f} м²)", subheading_style))
                 
-                # Создаем точки с шагом 0.1 м
-                step = 0.1
-                x_points = np.arange(0, L + step, step)
-                # Убедимся, что последняя точка точно равна L
-                if x_points[-1] > L:
-                    x_points[-1] = L
-                elif x_points[-1] < L:
-                    x_points = np.append(x_points, L)
-                
                 # Создаем данные для таблицы
+                samples = self.post.detailed_samples([bar_idx], **sampling)
                 detailed_data = [["Индекс", "x, м", "Nx, Н", "σx, Па", "Ux, м"]]
-                
-                for i, x in enumerate(x_points):
-                    # Расчет компонент НДС
-                    Nx = self.N_coeffs[bar_idx][0] + x * self.N_coeffs[bar_idx][1]
-                    sigma_x = Nx / A
-                    Ux = (self.U_coeffs[bar_idx][0] + 
-                        x * self.U_coeffs[bar_idx][1] + 
-                        (x**2) * self.U_coeffs[bar_idx][2])
-                    
-                    detailed_data.append([
-                        str(i),
-                        f"{x:.4f}",
-                        f"{Nx:.4f}",
-                        f"{sigma_x:.4f}",
-                        f"{Ux:.8f}"
-                    ])
+                detailed_data.extend(
+                    [str(i), f"{x:.4f}", f"{Nx:.4f}", f"{sigma_x:.4f}", f"{Ux:.8f}"]
+                    for i, x, Nx, sigma_x, Ux in zip(*(
+                        samples[key].tolist() for key in ('index', 'x_local', 'Nx', 'σx', 'Ux')
+                    ))
+                )
                 
                 # Создаем таблицу с детальными результатами
                 detailed_table = Table(detailed_data, colWidths=[20*mm, 25*mm, 35*mm, 35*mm, 45*mm])
@@ -0,0 +1,103 @@
+# sweep.py
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from barset import BarSet
+from processor import RodStructureProcessor, node_forces_to_array, evaluate_batch
+
+
+def _run_chunk(columns, node_loads, fixed, support_values, param_bars, param_fields, values):
+    """
+    Расчёт пачки вариантов параметров (выполняется в дочернем процессе)
+    values - массив (n_runs, n_params) значений варьируемых параметров
+    Все варианты пачки собираются и решаются одним пакетом
+    """
+    n_runs = len(values)
+    L, A, E, sigma, q = (np.tile(column, (n_runs, 1)) for column in columns)
+    targets = {'L': L, 'A': A, 'E': E}
+    for j, (bar, field) in enumerate(zip(param_bars, param_fields)):
+        targets[field][:, bar] = values[:, j]
+
+    node_loads = np.broadcast_to(node_loads, (n_runs, len(node_loads)))
+    _, max_sigma, max_Ux = evaluate_batch(L, A, E, q, node_loads, fixed, support_values)
+    passed = np.all(max_sigma <= sigma, axis=1)
+    return max_sigma, max_Ux, passed
+
+
+class ParametricSweep:
+    """
+    Перебор сетки значений L, A, E выбранных стержней
+    Варианты считаются пачками в пуле процессов, результаты собираются
+    в один структурированный массив NumPy.
+    На Windows вызов run() должен находиться под if __name__ == "__main__"
+    """
+    FIELDS = ('L', 'A', 'E')
+
+    def __init__(self, bars, node_forces, supports):
+        self.bars = BarSet.coerce(bars)
+        self.node_forces = node_forces
+        self.supports = supports
+
+        processor = RodStructureProcessor(self.bars, node_forces, supports)
+        self.fixed, self.support_values = processor.get_fixed_dofs()
+        self.node_loads = node_forces_to_array(node_forces, processor.n_nodes)
+        self.param_keys = []
+
+    def build_grid(self, ranges):
+        """
+        ranges - словарь {(индекс стержня, 'L' | 'A' | 'E'): последовательность значений}
+        Возвращает список параметров и массив всех сочетаний (n_runs, n_params)
+        """
+        keys = list(ranges.keys())
+        for bar, field in keys:
+            if field not in self.FIELDS:
+                raise ValueError(f"Недопустимый параметр '{field}': можно варьировать только L, A, E")
+            if not 0 <= bar < len(self.bars):
+                raise ValueError(f"Стержень {bar + 1} вне диапазона (1..{len(self.bars)})")
+
+        axes = [np.asarray(ranges[key], dtype=float).reshape(-1) for key in keys]
+        grid = np.meshgrid(*axes, indexing='ij')
+        values = np.stack([g.reshape(-1) for g in grid], axis=1) if axes else np.empty((1, 0))
+        return keys, values
+
+    def result_dtype(self, n_params):
+        return np.dtype([
+            ('params', float, (n_params,)),
+            ('max_sigma', float, (len(self.bars),)),
+            ('max_Ux', float),
+            ('passed', bool),
+        ])
+
+    def run(self, ranges, max_workers=None, chunk_size=256):
+        """
+        Расчёт всех сочетаний параметров
+        max_workers - число процессов (1 - расчёт в текущем процессе)
+        Возвращает структурированный массив с полями:
+        params - значения варьируемых параметров,
+        max_sigma - наибольшее |σx| по каждому стержню,
+        max_Ux - наибольшее |Ux| по конструкции,
+        passed - выполнение условия прочности для всех стержней
+        """
+        self.param_keys, values = self.build_grid(ranges)
+        results = np.empty(len(values), dtype=self.result_dtype(len(self.param_keys)))
+        if len(values) == 0:
+            return results
+
+        param_bars = [bar for bar, _ in self.param_keys]
+        param_fields = [field for _, field in self.param_keys]
+        columns = (self.bars.L, self.bars.A, self.bars.E, self.bars.sigma, self.bars.q)
+
+        chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+        args = (columns, self.node_loads, self.fixed, self.support_values, param_bars, param_fields)
+
+        if max_workers == 1 or len(chunks) == 1:
+            outputs = [_run_chunk(*args, chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_run_chunk, *args, chunk) for chunk in chunks]
+                outputs = [future.result() for future in futures]
+
+        results['params'] = values
+        results['max_sigma'] = np.concatenate([out[0] for out in outputs])
+        results['max_Ux'] = np.concatenate([out[1] for out in outputs])
+        results['passed'] = np.concatenate([out[2] for out in outputs])
+        return results
@@ -0,0 +1,248 @@
+# table_models.py
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+
+class ArrayTableModel(QAbstractTableModel):
+    """
+    Таблица только для чтения поверх массивов результатов
+    Каждый столбец - последовательность значений (массив NumPy или range)
+    и функция форматирования; строки форматируются только при запросе
+    представлением, т.е. для видимых ячеек
+    """
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._columns = []
+        self._backgrounds = {}
+        self._rows = 0
+
+    def set_columns(self, columns, backgrounds=None):
+        """
+        Замена данных таблицы
+        columns - список пар (значения, формат) по числу заголовков;
+        формат - строка для str.format или функция значение -> текст
+        backgrounds - словарь {номер столбца: функция значение -> QColor}
+        """
+        self.beginResetModel()
+        self._columns = [
+            (values, fmt.format if isinstance(fmt, str) else fmt)
+            for values, fmt in columns
+        ]
+        self._backgrounds = dict(backgrounds or {})
+        self._rows = len(columns[0][0]) if columns else 0
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.column() >= len(self._columns):
+            return None
+        values, fmt = self._columns[index.column()]
+        if role == Qt.DisplayRole:
+            return fmt(values[index.row()])
+        if role == Qt.BackgroundRole:
+            background = self._backgrounds.get(index.column())
+            if background is not None:
+                return background(values[index.row()])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class InputTableModel(QAbstractTableModel):
+    """
+    Редактируемая таблица исходных данных поверх массива float64
+    Пустая ячейка хранится как NaN. Текст, который не совпадает с записью
+    числа (некорректное или иначе записанное значение), хранится отдельно,
+    поэтому ячейка показывает ровно то, что ввёл пользователь
+    integer_columns - столбцы целых номеров (узлов, стержней)
+    """
+    ERROR_COLOR = QColor(255, 180, 180)
+    ERROR_TOOLTIP = "Некорректное значение"
+
+    def __init__(self, headers, integer_columns=(), parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._integer = frozenset(integer_columns)
+        columns = len(self._headers)
+        self._values = np.empty((0, columns))
+        self._errors = np.zeros((0, columns), dtype=bool)
+        self._texts = {}
+
+    def format_value(self, col, value):
+        """
+        Запись числа в ячейке; пустая строка для NaN
+        """
+        if np.isnan(value):
+            return ''
+        if col in self._integer:
+            return str(int(value))
+        return str(float(value))
+
+    def parse_text(self, col, text):
+        """
+        Разбор введённого текста: (значение или NaN, текст для хранения или None)
+        """
+        stripped = text.strip()
+        if not stripped:
+            return np.nan, None
+        try:
+            value = float(int(stripped) if col in self._integer else float(stripped))
+        except (ValueError, OverflowError):
+            return np.nan, text
+        if self.format_value(col, value) == text:
+            return value, None
+        return value, text
+
+    def text(self, row, col):
+        """
+        Текст ячейки, как он отображается в таблице
+        """
+        text = self._texts.get((row, col))
+        if text is not None:
+            return text
+        return self.format_value(col, self._values[row, col])
+
+    def has_texts(self, row):
+        """
+        Есть ли в строке ячейки с сохранённым текстом
+        Строку без них можно разбирать прямо по значениям
+        """
+        return bool(self._texts) and any((row, col) in self._texts for col in range(len(self._headers)))
+
+    def row_values(self, row):
+        """
+        Значения строки списком чисел (NaN для пустых ячеек)
+        """
+        return self._values[row].tolist()
+
+    def reset(self, columns):
+        """
+        Замена всех строк за одну операцию
+        columns - последовательности исходных значений по столбцам (числа или текст)
+        """
+        rows = len(columns[0]) if columns else 0
+        values = np.full((rows, len(self._headers)), np.nan)
+        texts = {}
+        for col, items in enumerate(columns):
+            kinds = (int,) if col in self._integer else (int, float)
+            if all(type(item) in kinds for item in items):
+                try:
+                    values[:, col] = items
+                except OverflowError:
+                    pass
+                else:
+                    if col not in self._integer:
+                        # Целое число в дробном столбце показывается так, как записано
+                        texts.update(
+                            ((row, col), str(item))
+                            for row, item in enumerate(items) if type(item) is int
+                        )
+                    continue
+            for row, item in enumerate(items):
+                values[row, col], text = self.parse_text(col, str(item))
+                if text is not None:
+                    texts[(row, col)] = text
+
+        self.beginResetModel()
+        self._values = values
+        self._errors = np.zeros(values.shape, dtype=bool)
+        self._texts = texts
+        self.endResetModel()
+
+    def clear(self):
+        self.reset([[] for _ in self._headers])
+
+    def set_errors(self, cells):
+        """
+        Подсветка ячеек с ошибками; cells - множество (строка, столбец)
+        Сигнал об изменении отправляется только для ячеек, у которых
+        изменилось состояние
+        """
+        errors = np.zeros(self._errors.shape, dtype=bool)
+        if cells:
+            rows, cols = np.array(list(cells)).T
+            errors[rows, cols] = True
+        changed = np.argwhere(errors != self._errors)
+        self._errors = errors
+        roles = [Qt.BackgroundRole, Qt.ToolTipRole]
+        for row, col in changed.tolist():
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, roles)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._values)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self.text(row, col)
+        if role == Qt.BackgroundRole and self._errors[row, col]:
+            return self.ERROR_COLOR
+        if role == Qt.ToolTipRole and self._errors[row, col]:
+            return self.ERROR_TOOLTIP
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        self._values[row, col], text = self.parse_text(col, '' if value is None else str(value))
+        if text is None:
+            self._texts.pop((row, col), None)
+        else:
+            self._texts[(row, col)] = text
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or not 0 <= row <= len(self._values):
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._values = np.insert(self._values, [row] * count, np.nan, axis=0)
+        self._errors = np.insert(self._errors, [row] * count, False, axis=0)
+        self._texts = {
+            (r + count if r >= row else r, c): text for (r, c), text in self._texts.items()
+        }
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._values):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        self._values = np.delete(self._values, np.s_[row:row + count], axis=0)
+        self._errors = np.delete(self._errors, np.s_[row:row + count], axis=0)
+        self._texts = {
+            (r - count if r >= row + count else r, c): text
+            for (r, c), text in self._texts.items()
+            if not row <= r < row + count
+        }
+        self.endRemoveRows()
+        return True
@@ -0,0 +1,125 @@
+# workers.py
+import threading
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from processor import RodStructureProcessor
+from postprocessor import PostProcessor
+
+
+class CalculationCancelled(Exception):
+    """
+    Расчёт отменён пользователем
+    """
+
+
+class CalculationSignals(QObject):
+    """
+    Сигналы фонового расчёта; доставляются в поток интерфейса
+    progress - номер этапа (с 1), число этапов, описание этапа
+    finished - словарь результатов
+    failed - текст ошибки
+    """
+    progress = Signal(int, int, str)
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+
+class CalculationWorker(QRunnable):
+    """
+    Расчёт в пуле потоков: решение системы, коэффициенты N(x) и u(x),
+    подготовка геометрии эпюр и экстремумов для окна результатов.
+    Отмена проверяется между этапами и между шагами внутри этапов
+    (коэффициенты N и u, каждая эпюра, экстремумы). Сами шаги векторизованы
+    и не прерываются: отмена срабатывает по завершении текущего шага
+    """
+    STAGES = (
+        "решение системы",
+        "коэффициенты N(x) и u(x)",
+        "подготовка эпюр",
+    )
+
+    def __init__(self, bars, node_forces, supports):
+        super().__init__()
+        # Снимок модели: таблицы ввода могут меняться во время расчёта
+        self.bars = bars.copy()
+        self.node_forces = [dict(f) for f in node_forces]
+        self.supports = [dict(s) for s in supports]
+        self.signals = CalculationSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """
+        Прерывание расчёта, если запрошена отмена
+        """
+        if self.is_cancelled:
+            raise CalculationCancelled()
+
+    def stage(self, index):
+        """
+        Переход к этапу index (с 1) с проверкой отмены
+        """
+        self.check_cancelled()
+        self.signals.progress.emit(index, len(self.STAGES), self.STAGES[index - 1])
+
+    def run(self):
+        try:
+            self.stage(1)
+            processor = RodStructureProcessor(self.bars, self.node_forces, self.supports)
+            delta = processor.solve()
+
+            self.stage(2)
+            N_coeffs = processor.calculate_internal_forces_coefficients_array(delta)
+            self.check_cancelled()
+            U_coeffs = processor.calculate_displacement_coefficients_array(delta)
+
+            self.stage(3)
+            post = PostProcessor(self.bars, N_coeffs, U_coeffs)
+            for component in ('Nx', 'σx', 'Ux'):
+                self.check_cancelled()
+                post.epure_geometry(component)
+            self.check_cancelled()
+            post.calculate_extrema()
+
+            self.check_cancelled()
+            self.signals.finished.emit({
+                'bars': self.bars,
+                'supports': self.supports,
+                'node_forces': self.node_forces,
+                'U': delta,
+                'N_coeffs': N_coeffs,
+                'U_coeffs': U_coeffs,
+                'post': post,
+            })
+        except CalculationCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class _WarmUp(QRunnable):
+    def run(self):
+        pass
+
+
+_calculation_pool = None
+
+
+def calculation_pool():
+    """
+    Пул из одного постоянного потока для расчётов
+    Поток создаётся заранее и не завершается между расчётами
+    """
+    global _calculation_pool
+    if _calculation_pool is None:
+        _calculation_pool = QThreadPool()
+        _calculation_pool.setMaxThreadCount(1)
+        _calculation_pool.setExpiryTimeout(-1)
+        _calculation_pool.start(_WarmUp())
+    return _calculation_pool